@@ -2,6 +2,7 @@
 """Quick script to check OKX balance and see all assets."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the trading_bot directory to Python path
@@ -10,6 +11,25 @@ sys.path.insert(0, str(Path(__file__).parent / "trading_bot"))
 from trading_bot.connectors.okx import OkxConnector
 from trading_bot.config import Config
 
+def fetch_usdt_tickers(okx, symbols):
+    """Fetch tickers in one batch call, or concurrently per symbol if batching is unavailable."""
+    if not symbols:
+        return {}
+    try:
+        return okx.fetch_tickers(symbols)
+    except Exception as e:
+        print(f"⚠️ Batch ticker fetch failed ({e}) - fetching per symbol")
+
+    def _ticker(symbol):
+        try:
+            return symbol, okx.fetch_ticker(symbol)
+        except Exception:
+            return symbol, None
+
+    with ThreadPoolExecutor(max_workers=min(16, len(symbols))) as executor:
+        results = list(executor.map(_ticker, symbols))
+    return {symbol: ticker for symbol, ticker in results if ticker}
+
 def main():
     """Check balance and show all assets."""
     print("🔄 Checking OKX balance...")
@@ -36,6 +56,10 @@ def main():
         qualifying_assets = 0
         min_threshold = 1.0  # $1 threshold
         
+        # Price every held asset with a single batch request
+        symbols = [f"{asset}/USDT" for asset, amount in balance["free"].items() if amount > 0 and asset != "USDT"]
+        tickers = fetch_usdt_tickers(okx, symbols)
+        
         for asset, amount in balance["free"].items():
             if amount <= 0:
                 continue
@@ -48,7 +72,10 @@ def main():
                     price = 1.0
                 else:
                     symbol = f"{asset}/USDT"
-                    ticker = okx.fetch_ticker(symbol)
+                    ticker = tickers.get(symbol)
+                    if not ticker:
+                        print(f"❌ NO PRICE | {asset:8} | {amount:15.6f} @ no {symbol} ticker")
+                        continue
                     price = float(ticker["last"])
                     value = amount * price
                 
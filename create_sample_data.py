@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Create sample trade data for testing the Excel reporting system."""
 
-import json
 import random
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterator
 
-def create_sample_trades(num_trades: int = 50) -> list:
-    """Create sample trade data for testing."""
+import numpy as np
+import orjson
+
+def create_sample_trades(num_trades: int = 50) -> Iterator[dict]:
+    """Yield sample trade records for testing."""
     
     symbols = [
         "BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT", "DOT/USDT",
@@ -21,70 +24,74 @@ def create_sample_trades(num_trades: int = 50) -> list:
         "intelligent-sell", "stop-loss-hit", "take-profit-hit"
     ]
     
-    trades = []
     base_time = datetime.now() - timedelta(days=30)
+    rng = np.random.default_rng()
+    
+    # Prices, sizes and PnL for every trade in one vectorised pass
+    entry_prices = rng.uniform(0.1, 50000, num_trades)  # Wide range for different assets
+    price_change_pct = rng.normal(0.5, 8.0, num_trades)  # Slight positive bias
+    exit_prices = entry_prices * (1 + price_change_pct / 100)
+    
+    # Trade amount (simulate 5% position sizing on a $10k portfolio)
+    portfolio_value = 10000
+    position_value = portfolio_value * 0.05
+    amounts = position_value / entry_prices
+    
+    pnl_usd = (exit_prices - entry_prices) * amounts
+    pnl_percentage = (exit_prices - entry_prices) / entry_prices * 100
+    
+    # Rounded values as plain Python floats for JSON output
+    entry_prices_out = np.round(entry_prices, 6).tolist()
+    exit_prices_out = np.round(exit_prices, 6).tolist()
+    amounts_out = np.round(amounts, 6).tolist()
+    pnl_usd_out = np.round(pnl_usd, 2).tolist()
+    pnl_percentage_out = np.round(pnl_percentage, 2).tolist()
+    pnl_usd = pnl_usd.tolist()
+    pnl_percentage = pnl_percentage.tolist()
+    
+    # Trade timing as epoch floats: entries over 30 days, held 1 hour to 3 days
+    base_ts = base_time.timestamp()
+    entry_ts = base_ts + rng.uniform(0, 30 * 86400, num_trades)
+    exit_ts = entry_ts + rng.uniform(3600, 72 * 3600, num_trades)
+    entry_ts = entry_ts.tolist()
+    exit_ts = exit_ts.tolist()
+    
+    # Bind the random helpers locally to skip module attribute lookups in the loop
+    choice = random.choice
+    uniform = random.uniform
     
     for i in range(num_trades):
-        # Random trade timing
-        entry_time = base_time + timedelta(
-            days=random.randint(0, 29),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        # Trade duration (1 hour to 3 days)
-        duration_hours = random.uniform(1, 72)
-        exit_time = entry_time + timedelta(hours=duration_hours)
-        
-        # Random symbol and prices
-        symbol = random.choice(symbols)
-        entry_price = random.uniform(0.1, 50000)  # Wide range for different assets
-        
-        # Generate realistic price movement
-        price_change_pct = random.normalvariate(0.5, 8.0)  # Slight positive bias
-        exit_price = entry_price * (1 + price_change_pct / 100)
-        
-        # Trade amount (simulate 5% position sizing)
-        portfolio_value = 10000  # Assume $10k portfolio
-        position_value = portfolio_value * 0.05  # 5% position
-        amount = position_value / entry_price
-        
-        # Calculate PnL
-        pnl_usd = (exit_price - entry_price) * amount
-        pnl_percentage = ((exit_price - entry_price) / entry_price) * 100
+        # Random symbol
+        symbol = choice(symbols)
         
         # Random confidence (higher for winning trades)
-        base_confidence = random.uniform(0.3, 0.9)
-        if pnl_usd > 0:
+        base_confidence = uniform(0.3, 0.9)
+        if pnl_usd[i] > 0:
             confidence = min(base_confidence + 0.1, 0.95)  # Boost for winners
         else:
             confidence = max(base_confidence - 0.1, 0.25)  # Reduce for losers
         
         # Exit reason (biased based on performance)
-        if pnl_percentage > 5:
-            reason = random.choice(["quick-profit-taking", "large-profit-protection", "take-profit-hit"])
-        elif pnl_percentage < -3:
-            reason = random.choice(["loss-limitation-low-confidence", "stop-loss-hit", "sentiment-deterioration"])
+        if pnl_percentage[i] > 5:
+            reason = choice(["quick-profit-taking", "large-profit-protection", "take-profit-hit"])
+        elif pnl_percentage[i] < -3:
+            reason = choice(["loss-limitation-low-confidence", "stop-loss-hit", "sentiment-deterioration"])
         else:
-            reason = random.choice(exit_reasons)
+            reason = choice(exit_reasons)
         
-        trade = {
+        yield {
             "symbol": symbol,
             "side": "BUY",
-            "entry_price": round(entry_price, 6),
-            "exit_price": round(exit_price, 6),
-            "amount": round(amount, 6),
-            "entry_time": entry_time.timestamp(),
-            "exit_time": exit_time.timestamp(),
-            "pnl_usd": round(pnl_usd, 2),
-            "pnl_percentage": round(pnl_percentage, 2),
+            "entry_price": entry_prices_out[i],
+            "exit_price": exit_prices_out[i],
+            "amount": amounts_out[i],
+            "entry_time": entry_ts[i],
+            "exit_time": exit_ts[i],
+            "pnl_usd": pnl_usd_out[i],
+            "pnl_percentage": pnl_percentage_out[i],
             "reason": reason,
             "confidence": round(confidence, 2)
         }
-        
-        trades.append(trade)
-    
-    return trades
 
 def main():
     """Create sample data and save to file."""
@@ -94,19 +101,23 @@ def main():
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
     
-    # Generate sample trades
-    trades = create_sample_trades(75)  # 75 sample trades
-    
-    # Save to JSON file
+    # Stream sample trades into a JSON array one record at a time,
+    # tallying basic stats as we go instead of holding the full list
     trades_file = data_dir / "daily_trades.json"
-    with open(trades_file, 'w') as f:
-        json.dump(trades, f, indent=2)
+    total_trades = 0
+    winning_trades = 0
+    total_pnl = 0.0
+    with open(trades_file, 'wb') as f:
+        f.write(b"[")
+        for trade in create_sample_trades(75):  # 75 sample trades
+            f.write(b",\n  " if total_trades else b"\n  ")
+            f.write(orjson.dumps(trade))
+            total_trades += 1
+            winning_trades += trade['pnl_usd'] > 0
+            total_pnl += trade['pnl_usd']
+        f.write(b"\n]\n")
     
-    # Calculate some basic stats
-    total_trades = len(trades)
-    winning_trades = len([t for t in trades if t['pnl_usd'] > 0])
     win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-    total_pnl = sum(t['pnl_usd'] for t in trades)
     
     print(f"✅ Created {total_trades} sample trades")
     print(f"📊 Win Rate: {win_rate:.1f}%")
@@ -6,34 +6,226 @@ from discord.ext import commands, tasks
 from discord.ui import Button, View
 import os
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import date
 import asyncio
+import heapq
 import logging
 import json
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from trading_bot.analytics.daily_performance import get_performance_tracker, warm_summary_kernel
+from trading_bot.monitoring.performance_monitor import get_performance_monitor
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# discord.py serialises HTTP/gateway payloads with orjson whenever it can import it, no patching needed
+if not getattr(discord.utils, "HAS_ORJSON", False):
+    logger.warning("⚠️ orjson not installed - discord.py is falling back to the stdlib json module")
+
 load_dotenv()
 
 # Bot setup
 intents = discord.Intents.default()
-intents.message_content = True
-intents.members = True
-intents.presences = True
+intents.message_content = True  # Prefix commands; no command needs member or presence data
 bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
 
 # Configuration
 DISCORD_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", "0"))
 
-# Cache for performance data
+# Cache for performance data, keyed by (method, days)
+# Valid while the tracker's trade version and the calendar day are unchanged
 performance_cache = {
-    "last_update": None,
-    "data": None
+    "version": None,
+    "data": {}
 }
+_tracker_singleton = None
+
+# Where the posted welcome message is remembered across restarts
+WELCOME_STATE_FILE = Path(os.getenv("DISCORD_WELCOME_FILE", "data/discord_welcome.json"))
+# Set to confirm the remembered message still exists (one fetch) before skipping the post
+VERIFY_WELCOME = os.getenv("DISCORD_VERIFY_WELCOME", "").lower() in ("1", "true", "yes")
+
+# Worker threads backing asyncio.to_thread, installed as the loop's default executor in on_ready
+STATS_EXECUTOR_WORKERS = 4
+_stats_executor = None
+
+
+def _get_cached_tracker():
+    """Return the shared performance tracker instead of reloading trade files per click."""
+    global _tracker_singleton
+    if _tracker_singleton is None:
+        _tracker_singleton = get_performance_tracker()
+    return _tracker_singleton
+
+
+def _save_welcome_state(channel_id: int, message_id: int):
+    """Remember the welcome message so later startups don't post it again."""
+    try:
+        WELCOME_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        WELCOME_STATE_FILE.write_text(json.dumps({"channel_id": channel_id, "message_id": message_id}))
+    except OSError as e:
+        logger.warning(f"Could not save welcome state: {e}")
+
+
+async def _welcome_already_posted(channel) -> bool:
+    """True if the welcome message was already posted to ``channel``."""
+    try:
+        state = json.loads(WELCOME_STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    if state.get("channel_id") != channel.id:
+        return False
+    if VERIFY_WELCOME:
+        try:
+            await channel.fetch_message(state["message_id"])
+        except discord.NotFound:
+            return False
+    return True
+
+
+async def _cached_stats(method: str, days=None):
+    """Call a tracker stats method, reusing the result until a trade opens/closes or the day rolls.
+
+    ``method`` is "daily", "summary" (one window) or "summaries" (a tuple of windows).
+    Cache misses run in a worker thread so the tracker's file I/O never blocks the event loop.
+    """
+    tracker = _get_cached_tracker()
+    version = (tracker._version, date.today().toordinal())
+    if performance_cache["version"] != version:
+        performance_cache["version"] = version
+        performance_cache["data"].clear()
+    
+    key = (method, days)
+    if key in performance_cache["data"]:
+        return performance_cache["data"][key]
+    
+    if method == "daily":
+        result = await asyncio.to_thread(tracker.get_daily_performance)
+    elif method == "summaries":
+        result = await asyncio.to_thread(tracker.get_profit_summaries, list(days))
+    else:
+        result = await asyncio.to_thread(tracker.get_profit_summary, days=days)
+    
+    # Don't cache across a trade that landed while the worker thread was computing
+    if performance_cache["version"] == version and tracker._version == version[0]:
+        performance_cache["data"][key] = result
+    return result
+
+# [epoch second, "%H:%M:%S", "%Y-%m-%d %H:%M:%S"] for the last formatted second
+_ts_cache = [0, "", ""]
+
+
+def _refresh_ts_cache():
+    t = int(time.time())
+    if _ts_cache[0] != t:
+        tm = time.localtime(t)
+        _ts_cache[:] = [t, time.strftime('%H:%M:%S', tm), time.strftime('%Y-%m-%d %H:%M:%S', tm)]
+
+
+def _now_hms():
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    _refresh_ts_cache()
+    return _ts_cache[1]
+
+
+def _now_full():
+    """Current local time as YYYY-MM-DD HH:MM:SS, formatted at most once per second."""
+    _refresh_ts_cache()
+    return _ts_cache[2]
+
+
+def _format_epoch(ts):
+    """Format an epoch timestamp (as stored on TradeRecord) as local YYYY-MM-DD HH:MM:SS."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+def _format_profit_factor(value, suffix="x"):
+    """Profit factor to two decimals; a window with wins but no losses has no finite ratio."""
+    if value == float('inf'):
+        return "No losses"
+    return f"{value:.2f}{suffix}"
+
+# Trades closing within this window are reported in one update
+SIGNAL_DEBOUNCE_SECONDS = 5.0
+# Minimum spacing between performance updates posted to the channel
+SIGNAL_MIN_INTERVAL_SECONDS = 30.0
+
+# Above this many trades, top-symbol aggregation runs vectorised in a worker thread
+TOP_SYMBOLS_VECTORIZE_THRESHOLD = 1000
+
+
+def _top_symbols(tracker, n=5):
+    """Return the n best symbols by PnL as (symbol, (pnl, trades, wins)) pairs."""
+    if len(tracker.trades) < TOP_SYMBOLS_VECTORIZE_THRESHOLD:
+        # symbol -> [pnl, trades, wins]
+        symbol_stats = defaultdict(lambda: [0.0, 0, 0])
+        for trade in tracker.trades:
+            pnl = trade.pnl_usd or 0
+            row = symbol_stats[trade.symbol]
+            row[0] += pnl
+            row[1] += 1
+            row[2] += pnl > 0
+        return heapq.nlargest(n, symbol_stats.items(), key=lambda x: x[1][0])
+    
+    return _symbol_pnl_table(tracker, n)
+
+
+def _symbol_pnl_table(tracker, n=5):
+    """Vectorised _top_symbols: group the tracker's cached PnL arrays with unique + bincount."""
+    symbols, pnl, wins = tracker.get_pnl_arrays()
+    if not len(symbols):
+        return []
+    uniq, inv = np.unique(symbols, return_inverse=True)
+    total = np.bincount(inv, weights=pnl)
+    count = np.bincount(inv)
+    win_count = np.bincount(inv, weights=wins.astype(np.float64))
+    
+    if len(uniq) > n:
+        idx = np.argpartition(-total, n)[:n]  # Top n unordered, no full sort
+    else:
+        idx = np.arange(len(uniq))
+    idx = idx[np.argsort(-total[idx], kind="stable")]
+    return [(uniq[i], (float(total[i]), int(count[i]), int(win_count[i]))) for i in idx]
+
+
+class ChannelRateLimiter:
+    """Token bucket for channel sends: ``capacity`` messages per ``per`` seconds."""
+    
+    def __init__(self, capacity: int = 5, per: float = 5.0):
+        self._capacity = capacity
+        self._rate = capacity / per
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def block_for(self, seconds: float):
+        """Hold all sends for ``seconds`` (e.g. Discord's X-RateLimit-Reset-After)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
 
 # Custom Views for Button Navigation
 class MainMenuView(View):
@@ -43,35 +235,35 @@ class MainMenuView(View):
         super().__init__(timeout=None)  # Never timeout
         self.cog = cog
     
-    @discord.ui.button(label="📊 Performance", style=discord.ButtonStyle.primary, emoji="📊")
+    @discord.ui.button(label="📊 Performance", style=discord.ButtonStyle.primary, emoji="📊", custom_id="menu:performance")
     async def performance_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_performance(interaction)
     
-    @discord.ui.button(label="📅 Daily", style=discord.ButtonStyle.primary, emoji="📅")
+    @discord.ui.button(label="📅 Daily", style=discord.ButtonStyle.primary, emoji="📅", custom_id="menu:daily")
     async def daily_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_daily(interaction)
     
-    @discord.ui.button(label="📈 Trades", style=discord.ButtonStyle.primary, emoji="📈")
+    @discord.ui.button(label="📈 Trades", style=discord.ButtonStyle.primary, emoji="📈", custom_id="menu:trades")
     async def trades_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_trades(interaction)
     
-    @discord.ui.button(label="🏆 Top Symbols", style=discord.ButtonStyle.success, emoji="🏆")
+    @discord.ui.button(label="🏆 Top Symbols", style=discord.ButtonStyle.success, emoji="🏆", custom_id="menu:toptraders")
     async def toptraders_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_toptraders(interaction)
     
-    @discord.ui.button(label="💼 Portfolio", style=discord.ButtonStyle.success, emoji="💼")
+    @discord.ui.button(label="💼 Portfolio", style=discord.ButtonStyle.success, emoji="💼", custom_id="menu:portfolio")
     async def portfolio_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_portfolio(interaction)
     
-    @discord.ui.button(label="📊 Analytics", style=discord.ButtonStyle.success, emoji="📊")
+    @discord.ui.button(label="📊 Analytics", style=discord.ButtonStyle.success, emoji="📊", custom_id="menu:analytics")
     async def analytics_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_analytics(interaction)
     
-    @discord.ui.button(label="⚙️ Settings", style=discord.ButtonStyle.secondary, emoji="⚙️")
+    @discord.ui.button(label="⚙️ Settings", style=discord.ButtonStyle.secondary, emoji="⚙️", custom_id="menu:settings")
     async def settings_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_settings(interaction)
     
-    @discord.ui.button(label="💳 Subscribe", style=discord.ButtonStyle.danger, emoji="💳")
+    @discord.ui.button(label="💳 Subscribe", style=discord.ButtonStyle.danger, emoji="💳", custom_id="menu:subscribe")
     async def subscribe_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.show_subscribe(interaction)
 
@@ -83,113 +275,173 @@ class TradeDetailsView(View):
         self.trades = trades
         self.cog = cog
         self.current_page = 0
+        self._lock = asyncio.Lock()  # Serialises rapid clicks so pages don't race
+        # Render every page up front so paging is a list lookup
+        total = len(trades)
+        self._embeds = [cog._create_detailed_trade_embed(t, i + 1, total) for i, t in enumerate(trades)]
     
     @discord.ui.button(label="⬅️ Previous", style=discord.ButtonStyle.secondary)
     async def previous_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page > 0:
-            self.current_page -= 1
-            await self.update_trade_display(interaction)
-        else:
-            await interaction.response.defer()
+        async with self._lock:
+            if self.current_page > 0:
+                self.current_page -= 1
+                await self.update_trade_display(interaction)
+            else:
+                await interaction.response.defer()
     
     @discord.ui.button(label="➡️ Next", style=discord.ButtonStyle.secondary)
     async def next_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page < len(self.trades) - 1:
-            self.current_page += 1
-            await self.update_trade_display(interaction)
-        else:
-            await interaction.response.defer()
+        async with self._lock:
+            if self.current_page < len(self.trades) - 1:
+                self.current_page += 1
+                await self.update_trade_display(interaction)
+            else:
+                await interaction.response.defer()
     
     @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.primary)
     async def refresh_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.update_trade_display(interaction)
+        async with self._lock:
+            page = self.current_page
+            self._embeds[page] = self.cog._create_detailed_trade_embed(self.trades[page], page + 1, len(self.trades))
+            await self.update_trade_display(interaction)
     
     @discord.ui.button(label="📊 Back to Menu", style=discord.ButtonStyle.danger)
     async def back_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer()
     
     async def update_trade_display(self, interaction: discord.Interaction):
-        trade = self.trades[self.current_page]
-        embed = self.cog._create_detailed_trade_embed(trade, self.current_page + 1, len(self.trades))
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=self._embeds[self.current_page], view=self)
 
 class TradingSignals(commands.Cog):
     """Trading signal cog for real-time updates."""
     
+    # Per-channel send buckets, shared across loop iterations and callbacks
+    _send_buckets: dict[int, ChannelRateLimiter] = {}
+    
     def __init__(self, bot):
         self.bot = bot
-        self.signal_loop.start()
+        self._subscribe_embed = self._build_subscribe_embed()
+        self._settings_embed = self._build_settings_embed()
+        self._menu_embed = self._build_menu_embed()
+        self._alerts_embed = self._build_alerts_embed()
+        self._invite_embed = self._build_invite_embed()
+        self._help_embed = self._build_help_embed()
+        self._perf_embed = self._build_perf_template()
+        self._signal_task = None
+        self._last_embed_key: tuple = ()  # Stats behind the last performance update sent
         logger.info("✅ TradingSignals cog initialized")
     
-    @tasks.loop(minutes=1)
-    async def signal_loop(self):
-        """Send trading signals every minute."""
+    async def cog_load(self):
+        # Persistent view: one instance serves every !menu message and survives restarts
+        self._menu_view = MainMenuView(self)
+        self.bot.add_view(self._menu_view)
+        self._loop = asyncio.get_running_loop()
+        self._trade_queue = asyncio.Queue()
+        _get_cached_tracker().register_listener(self._on_trade)
+        self._signal_task = asyncio.create_task(self._signal_consumer())
+        self.heartbeat.start()
+    
+    async def cog_unload(self):
+        _get_cached_tracker().unregister_listener(self._on_trade)
+        self.heartbeat.cancel()
+        if self._signal_task:
+            self._signal_task.cancel()
+    
+    def _on_trade(self, trade):
+        """Tracker listener; runs on the trading thread, so only hand the trade to our loop."""
         try:
-            # Import here to avoid circular imports
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
-            daily_stats = tracker.get_daily_performance()
+            self._loop.call_soon_threadsafe(self._trade_queue.put_nowait, trade)
+        except RuntimeError:
+            pass  # Event loop already closed during shutdown
+    
+    async def _signal_consumer(self):
+        """Post a performance update whenever the tracker reports closed trades."""
+        loop = asyncio.get_running_loop()
+        queue = self._trade_queue
+        last_post = float("-inf")
+        while True:
+            await queue.get()
+            # Debounce: fold trades closing within the window into a single update,
+            # and never post more often than SIGNAL_MIN_INTERVAL_SECONDS
+            delay = max(SIGNAL_DEBOUNCE_SECONDS, last_post + SIGNAL_MIN_INTERVAL_SECONDS - loop.time())
+            await asyncio.sleep(delay)
+            while not queue.empty():
+                queue.get_nowait()
+            await self._post_performance_update()
+            last_post = loop.time()
+    
+    @tasks.loop(minutes=10)
+    async def heartbeat(self):
+        """Liveness check: restart the signal consumer if it ever died."""
+        if self._signal_task is None or self._signal_task.done():
+            if self._signal_task is not None and not self._signal_task.cancelled() and self._signal_task.exception():
+                logger.error(f"Signal consumer stopped: {self._signal_task.exception()}")
+            self._signal_task = asyncio.create_task(self._signal_consumer())
+        logger.debug("💓 Discord cog heartbeat")
+    
+    async def _post_performance_update(self):
+        """Send today's performance to the signals channel."""
+        try:
+            daily_stats = await _cached_stats("daily")
             
-            # Only send if there's activity
-            if daily_stats.total_trades > 0:
+            # Only send if there's activity, and never repeat an update whose numbers haven't moved
+            key = (daily_stats.total_trades, daily_stats.total_pnl_usd,
+                   daily_stats.winning_trades, daily_stats.losing_trades)
+            if daily_stats.total_trades > 0 and key != self._last_embed_key:
                 channel = self.bot.get_channel(CHANNEL_ID)
                 if channel:
-                    embed = self._create_performance_embed(daily_stats)
                     try:
-                        await channel.send(embed=embed)
+                        await self._send_rate_limited(channel, embed=self._create_performance_embed(daily_stats))
                     except Exception as e:
                         logger.error(f"Failed to send message: {e}")
+                    else:
+                        # Only a delivered update counts; a failed one is retried on the next signal
+                        self._last_embed_key = key
         
         except Exception as e:
-            logger.debug(f"Error in signal loop: {e}")
+            logger.debug(f"Error posting performance update: {e}")
+    
+    async def _send_rate_limited(self, channel, retries: int = 3, **kwargs):
+        """Send through the channel's token bucket, backing off on 429 as Discord instructs."""
+        bucket = self._send_buckets.setdefault(channel.id, ChannelRateLimiter())
+        for attempt in range(retries):
+            async with bucket:
+                try:
+                    return await channel.send(**kwargs)
+                except discord.HTTPException as e:
+                    if e.status != 429 or attempt == retries - 1:
+                        raise
+                    reset_after = float(e.response.headers.get("X-RateLimit-Reset-After", 1.0))
+                    logger.warning(f"Rate limited on channel {channel.id}, retrying in {reset_after:.2f}s")
+                    bucket.block_for(reset_after)
+    
+    # (name, value formatter) for each field of the performance update, in display order
+    _PERF_FIELDS = (
+        ("💰 Today's PnL", lambda st: f"${st.total_pnl_usd:.2f}"),
+        ("📈 Win Rate", lambda st: f"{st.win_rate:.1f}%"),
+        ("🎯 Total Trades", lambda st: f"{st.total_trades}"),
+        ("✅ Winning Trades", lambda st: f"{st.winning_trades}"),
+        ("❌ Losing Trades", lambda st: f"{st.losing_trades}"),
+        ("📊 Avg Win", lambda st: f"${st.avg_win:.2f}"),
+    )
+    
+    def _build_perf_template(self) -> discord.Embed:
+        """Build the performance update embed with placeholder fields, refilled per update."""
+        embed = discord.Embed(title="📊 Trading Bot Performance")
+        for name, _ in self._PERF_FIELDS:
+            embed.add_field(name=name, value="-", inline=True)
+        return embed
     
     def _create_performance_embed(self, stats):
-        """Create Discord embed for performance."""
-        color = discord.Color.green() if stats.total_pnl_usd > 0 else discord.Color.red()
-        
-        embed = discord.Embed(
-            title="📊 Trading Bot Performance",
-            description=f"Updated: {datetime.now().strftime('%H:%M:%S')}",
-            color=color
-        )
-        
-        embed.add_field(
-            name="💰 Today's PnL",
-            value=f"${stats.total_pnl_usd:.2f}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="📈 Win Rate",
-            value=f"{stats.win_rate:.1f}%",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🎯 Total Trades",
-            value=f"{stats.total_trades}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="✅ Winning Trades",
-            value=f"{stats.winning_trades}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="❌ Losing Trades",
-            value=f"{stats.losing_trades}",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="📊 Avg Win",
-            value=f"${stats.avg_win:.2f}",
-            inline=True
-        )
+        """Refresh the reusable performance embed in place and return it."""
+        embed = self._perf_embed
+        if len(embed.fields) != len(self._PERF_FIELDS):
+            embed = self._perf_embed = self._build_perf_template()
         
+        embed.colour = discord.Color.green() if stats.total_pnl_usd > 0 else discord.Color.red()
+        embed.description = f"Updated: {discord.utils.format_dt(discord.utils.utcnow(), style='T')}"
+        for i, (name, fmt) in enumerate(self._PERF_FIELDS):
+            embed.set_field_at(i, name=name, value=fmt(stats), inline=True)
         return embed
     
     def _create_detailed_trade_embed(self, trade, page: int = 1, total_pages: int = 1):
@@ -206,48 +458,57 @@ class TradingSignals(commands.Cog):
         )
         
         # Entry Information
+        entry_time_s = _format_epoch(trade.entry_time) if trade.entry_time else 'N/A'
         embed.add_field(
             name="📍 Entry",
-            value=f"Price: ${trade.entry_price:.8f}\n"
-                  f"Time: {trade.entry_time.strftime('%Y-%m-%d %H:%M:%S') if trade.entry_time else 'N/A'}\n"
-                  f"Amount: {trade.amount:.6f}",
+            value="\n".join((
+                "Price: $" + format(trade.entry_price, '.8f'),
+                "Time: " + entry_time_s,
+                "Amount: " + format(trade.amount, '.6f'),
+            )),
             inline=False
         )
         
         # Exit Information
         if trade.exit_price:
+            exit_time_s = _format_epoch(trade.exit_time) if trade.exit_time else 'N/A'
             embed.add_field(
                 name="📍 Exit",
-                value=f"Price: ${trade.exit_price:.8f}\n"
-                      f"Time: {trade.exit_time.strftime('%Y-%m-%d %H:%M:%S') if trade.exit_time else 'N/A'}\n"
-                      f"Reason: {trade.exit_reason or 'N/A'}",
+                value="\n".join((
+                    "Price: $" + format(trade.exit_price, '.8f'),
+                    "Time: " + exit_time_s,
+                    "Reason: " + (trade.reason or 'N/A'),
+                )),
                 inline=False
             )
         
         # P&L Information
+        pnl_pct_s = format(pnl_pct, '.2f')
         embed.add_field(
             name="💰 Profit & Loss",
-            value=f"PnL: ${pnl:.2f}\n"
-                  f"PnL %: {pnl_pct:.2f}%\n"
-                  f"ROI: {(pnl_pct):.2f}%",
+            value="\n".join((
+                "PnL: $" + format(pnl, '.2f'),
+                "PnL %: " + pnl_pct_s + "%",
+                "ROI: " + pnl_pct_s + "%",
+            )),
             inline=True
         )
         
         # Trade Details
         embed.add_field(
             name="📊 Trade Details",
-            value=f"Confidence: {getattr(trade, 'confidence', 'N/A')}\n"
-                  f"Confluence: {getattr(trade, 'confluence', 'N/A')}\n"
-                  f"Risk/Reward: {getattr(trade, 'risk_reward_ratio', 'N/A')}",
+            value=f"Confidence: {trade.confidence if trade.confidence is not None else 'N/A'}\n"
+                  f"Confluence: {trade.confluence if trade.confluence is not None else 'N/A'}\n"
+                  f"Risk/Reward: {trade.risk_reward_ratio if trade.risk_reward_ratio is not None else 'N/A'}",
             inline=True
         )
         
         # TP/SL Information
-        tp_value = getattr(trade, 'take_profit', None)
-        sl_value = getattr(trade, 'stop_loss', None)
+        tp_value = trade.take_profit
+        sl_value = trade.stop_loss
         
-        tp_text = f"${tp_value:.8f}" if tp_value else "Not Set"
-        sl_text = f"${sl_value:.8f}" if sl_value else "Not Set"
+        tp_text = "$" + format(tp_value, '.8f') if tp_value else "Not Set"
+        sl_text = "$" + format(sl_value, '.8f') if sl_value else "Not Set"
         
         embed.add_field(
             name="🎯 Take Profit / Stop Loss",
@@ -259,161 +520,20 @@ class TradingSignals(commands.Cog):
         # Additional Metrics
         embed.add_field(
             name="📈 Metrics",
-            value=f"Duration: {getattr(trade, 'duration', 'N/A')}\n"
-                  f"Max Drawdown: {getattr(trade, 'max_drawdown', 'N/A')}\n"
+            value=f"Duration: {trade.duration if trade.duration is not None else 'N/A'}\n"
+                  f"Max Drawdown: {trade.max_drawdown if trade.max_drawdown is not None else 'N/A'}\n"
                   f"Status: {'Closed' if trade.exit_price else 'Open'}",
             inline=True
         )
         
-        embed.set_footer(text=f"Trade ID: {getattr(trade, 'id', 'N/A')} | Updated: {datetime.now().strftime('%H:%M:%S')}")
+        # Footers don't render <t:...> markers; the embed timestamp is shown in the viewer's timezone
+        embed.set_footer(text=f"Trade ID: {trade.id if trade.id is not None else 'N/A'}")
+        embed.timestamp = discord.utils.utcnow()
         return embed
     
-    # Button callback methods
-    async def show_performance(self, interaction: discord.Interaction):
-        """Show performance metrics."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            # Create fresh instance to reload data from files
-            tracker = DailyPerformanceTracker()
-            stats = tracker.get_daily_performance()
-            summary = tracker.get_profit_summary(days=7)
-            
-            embed = discord.Embed(
-                title="📊 Trading Performance Summary",
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="📅 Today",
-                value=f"PnL: ${stats.total_pnl_usd:.2f} | Win Rate: {stats.win_rate:.1f}%",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📈 7-Day Summary",
-                value=f"PnL: ${summary.get('total_pnl_usd', 0):.2f} | Trades: {summary.get('total_trades', 0)}",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🎯 Win Rate (7-day)",
-                value=f"{summary.get('win_rate_pct', 0):.1f}%",
-                inline=False
-            )
-            
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
-    
-    async def show_daily(self, interaction: discord.Interaction):
-        """Show today's performance."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            tracker = DailyPerformanceTracker()
-            stats = tracker.get_daily_performance()
-            
-            color = discord.Color.green() if stats.total_pnl_usd > 0 else discord.Color.red()
-            
-            embed = discord.Embed(
-                title="📅 Today's Performance",
-                color=color
-            )
-            
-            embed.add_field(name="💰 PnL", value=f"${stats.total_pnl_usd:.2f}", inline=True)
-            embed.add_field(name="📈 Trades", value=f"{stats.total_trades}", inline=True)
-            embed.add_field(name="🎯 Win Rate", value=f"{stats.win_rate:.1f}%", inline=True)
-            embed.add_field(name="✅ Wins", value=f"{stats.winning_trades}", inline=True)
-            embed.add_field(name="❌ Losses", value=f"{stats.losing_trades}", inline=True)
-            embed.add_field(name="💵 Best Trade", value=f"${stats.best_trade:.2f}", inline=True)
-            
-            embed.set_footer(text=f"Updated: {datetime.now().strftime('%H:%M:%S')}")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
-    
-    async def show_trades(self, interaction: discord.Interaction):
-        """Show detailed trades with pagination."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            tracker = DailyPerformanceTracker()
-            recent_trades = tracker.trades[-10:] if tracker.trades else []
-            
-            if not recent_trades:
-                await interaction.response.send_message("❌ No trades found", ephemeral=True)
-                return
-            
-            # Reverse to show newest first
-            recent_trades = list(reversed(recent_trades))
-            
-            view = TradeDetailsView(recent_trades, self)
-            embed = self._create_detailed_trade_embed(recent_trades[0], 1, len(recent_trades))
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
-    
-    async def show_toptraders(self, interaction: discord.Interaction):
-        """Show top performing symbols."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            tracker = DailyPerformanceTracker()
-            
-            symbol_stats = {}
-            for trade in tracker.trades:
-                if trade.symbol not in symbol_stats:
-                    symbol_stats[trade.symbol] = {"pnl": 0, "trades": 0, "wins": 0}
-                
-                symbol_stats[trade.symbol]["trades"] += 1
-                symbol_stats[trade.symbol]["pnl"] += trade.pnl_usd or 0
-                if (trade.pnl_usd or 0) > 0:
-                    symbol_stats[trade.symbol]["wins"] += 1
-            
-            sorted_symbols = sorted(symbol_stats.items(), key=lambda x: x[1]["pnl"], reverse=True)[:5]
-            
-            embed = discord.Embed(title="🏆 Top Performing Symbols", color=discord.Color.gold())
-            
-            for i, (symbol, stats) in enumerate(sorted_symbols, 1):
-                win_rate = (stats["wins"] / stats["trades"] * 100) if stats["trades"] > 0 else 0
-                embed.add_field(
-                    name=f"#{i} {symbol}",
-                    value=f"PnL: ${stats['pnl']:.2f} | Trades: {stats['trades']} | Win Rate: {win_rate:.1f}%",
-                    inline=False
-                )
-            
-            if not sorted_symbols:
-                embed.description = "No trades yet"
-            
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
-    
-    async def show_portfolio(self, interaction: discord.Interaction):
-        """Show portfolio overview."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            tracker = DailyPerformanceTracker()
-            summary = tracker.get_profit_summary(days=30)
-            
-            embed = discord.Embed(title="💼 Portfolio Overview", color=discord.Color.blue())
-            
-            embed.add_field(name="📊 30-Day Performance", value=f"${summary.get('total_pnl_usd', 0):.2f}", inline=True)
-            embed.add_field(name="📈 Total Trades", value=f"{summary.get('total_trades', 0)}", inline=True)
-            embed.add_field(name="🎯 Win Rate", value=f"{summary.get('win_rate_pct', 0):.1f}%", inline=True)
-            embed.add_field(name="📊 Profit Factor", value=f"{summary.get('profit_factor', 0):.2f}x", inline=True)
-            embed.add_field(name="🎲 Best Trade", value=f"${summary.get('best_trade', 0):.2f}", inline=True)
-            embed.add_field(name="💸 Worst Trade", value=f"${summary.get('worst_trade', 0):.2f}", inline=True)
-            
-            embed.set_footer(text="Premium feature - Subscribe for more details")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
-    
-    async def show_subscribe(self, interaction: discord.Interaction):
-        """Show subscription options."""
+    # Static embeds, built once in __init__
+    def _build_subscribe_embed(self) -> discord.Embed:
+        """Build the static subscription options embed."""
         embed = discord.Embed(
             title="💳 Subscribe to Trading Bot Premium",
             description="Get real-time signals and advanced analytics",
@@ -447,59 +567,10 @@ class TradingSignals(commands.Cog):
         )
         
         embed.set_footer(text="Questions? Use !menu for support")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-    
-    async def show_analytics(self, interaction: discord.Interaction):
-        """Show advanced analytics and insights."""
-        try:
-            from trading_bot.analytics.daily_performance import DailyPerformanceTracker
-            
-            tracker = DailyPerformanceTracker()
-            summary_7d = tracker.get_profit_summary(days=7)
-            summary_30d = tracker.get_profit_summary(days=30)
-            
-            embed = discord.Embed(
-                title="📊 Advanced Analytics",
-                color=discord.Color.blurple(),
-                description="Detailed trading insights and metrics"
-            )
-            
-            # 7-Day Analysis
-            embed.add_field(
-                name="📈 7-Day Analysis",
-                value=f"PnL: ${summary_7d.get('total_pnl_usd', 0):.2f}\n"
-                      f"Trades: {summary_7d.get('total_trades', 0)}\n"
-                      f"Win Rate: {summary_7d.get('win_rate_pct', 0):.1f}%\n"
-                      f"Daily Avg: ${summary_7d.get('avg_daily_profit', 0):.2f}",
-                inline=True
-            )
-            
-            # 30-Day Analysis
-            embed.add_field(
-                name="📊 30-Day Analysis",
-                value=f"PnL: ${summary_30d.get('total_pnl_usd', 0):.2f}\n"
-                      f"Trades: {summary_30d.get('total_trades', 0)}\n"
-                      f"Win Rate: {summary_30d.get('win_rate_pct', 0):.1f}%\n"
-                      f"Daily Avg: ${summary_30d.get('avg_daily_profit', 0):.2f}",
-                inline=True
-            )
-            
-            # Risk Metrics
-            embed.add_field(
-                name="⚠️ Risk Metrics",
-                value=f"Profit Factor: {summary_30d.get('profit_factor', 0):.2f}x\n"
-                      f"Best Trade: ${summary_30d.get('best_trade', 0):.2f}\n"
-                      f"Worst Trade: ${summary_30d.get('worst_trade', 0):.2f}",
-                inline=False
-            )
-            
-            embed.set_footer(text="Premium Analytics | Updated: " + datetime.now().strftime('%H:%M:%S'))
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        return embed
     
-    async def show_settings(self, interaction: discord.Interaction):
-        """Show bot settings and preferences."""
+    def _build_settings_embed(self) -> discord.Embed:
+        """Build the static settings and preferences embed."""
         embed = discord.Embed(
             title="⚙️ Bot Settings & Preferences",
             color=discord.Color.greyple(),
@@ -540,11 +611,10 @@ class TradingSignals(commands.Cog):
         )
         
         embed.set_footer(text="Settings | Contact admin for changes")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
     
-    @commands.command()
-    async def menu(self, ctx):
-        """Show main menu with buttons."""
+    def _build_menu_embed(self) -> discord.Embed:
+        """Build the static main menu embed."""
         embed = discord.Embed(
             title="🤖 Trading Bot Dashboard",
             description="Click buttons below to navigate",
@@ -587,36 +657,303 @@ class TradingSignals(commands.Cog):
             inline=True
         )
         
-        view = MainMenuView(self)
-        await ctx.send(embed=embed, view=view)
+        return embed
     
-    @commands.command()
-    async def trades(self, ctx, limit: int = 10):
-        """Get recent trades."""
-        try:
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
-            recent_trades = tracker.trades[-limit:]
-            
-            if not recent_trades:
-                await ctx.send("❌ No trades found")
-                return
-            
-            embed = discord.Embed(
-                title=f"📋 Last {len(recent_trades)} Trades",
-                color=discord.Color.blue()
-            )
-            
-            for trade in recent_trades:
-                if trade.exit_price:
-                    pnl = trade.pnl_usd or 0
-                    pnl_pct = trade.pnl_percentage or 0
+    def _build_alerts_embed(self) -> discord.Embed:
+        """Build the static trading alerts embed."""
+        embed = discord.Embed(
+            title="🔔 Trading Alerts",
+            color=discord.Color.orange()
+        )
+        
+        embed.add_field(
+            name="📢 Alert Settings",
+            value="React with ✅ to enable alerts\n"
+                  "🔴 Large Loss Alert (>$100)\n"
+                  "🟢 Large Win Alert (>$100)\n"
+                  "📊 Daily Summary\n"
+                  "⚠️ Risk Warnings",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💡 Pro Tip",
+            value="Enable alerts to get notified of important trading events",
+            inline=False
+        )
+        
+        return embed
+    
+    def _build_invite_embed(self) -> discord.Embed:
+        """Build the static invite embed."""
+        embed = discord.Embed(
+            title="📨 Invite Friends",
+            description="Share the bot with your trading community!",
+            color=discord.Color.blue()
+        )
+        
+        embed.add_field(
+            name="🔗 Server Link",
+            value="Share this server with friends to get early access",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💰 Referral Bonus",
+            value="Refer 3 friends and get 1 month free premium!",
+            inline=False
+        )
+        
+        return embed
+    
+    def _build_help_embed(self) -> discord.Embed:
+        """Build the static command help embed."""
+        embed = discord.Embed(
+            title="📖 Trading Bot Commands",
+            color=discord.Color.blue(),
+            description="Complete list of available commands"
+        )
+        
+        embed.add_field(
+            name="📊 Performance Commands",
+            value="!performance - Get current metrics\n"
+                  "!daily - Today's performance\n"
+                  "!stats [days] - Statistics for N days\n"
+                  "!portfolio - 30-day portfolio overview",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📈 Trade Commands",
+            value="!trades [limit] - Get recent trades\n"
+                  "!toptraders - Top performing symbols",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="⚙️ Bot Commands",
+            value="!status - Get bot status\n"
+                  "!alerts - Trading alerts settings\n"
+                  "!invite - Invite friends",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💳 Premium Commands",
+            value="!subscribe - Subscribe to premium\n"
+                  "!help - Show this help message",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💡 Tips",
+            value="• Use !stats 7 for weekly stats\n"
+                  "• Use !stats 30 for monthly stats\n"
+                  "• Use !trades 20 for more trades\n"
+                  "• Premium members get more features",
+            inline=False
+        )
+        
+        embed.set_footer(text="Questions? DM @Admin for support")
+        
+        return embed
+    
+    # Button callback methods
+    async def show_performance(self, interaction: discord.Interaction):
+        """Show performance metrics."""
+        try:
+            stats, summary = await asyncio.gather(_cached_stats("daily"), _cached_stats("summary", 7))
+            
+            embed = discord.Embed.from_dict({
+                "title": "📊 Trading Performance Summary",
+                "color": discord.Color.blue().value,
+                "fields": [
+                    {"name": "📅 Today",
+                     "value": f"PnL: ${stats.total_pnl_usd:.2f} | Win Rate: {stats.win_rate:.1f}%", "inline": False},
+                    {"name": "📈 7-Day Summary",
+                     "value": f"PnL: ${summary.get('total_pnl_usd', 0):.2f} | Trades: {summary.get('total_trades', 0)}",
+                     "inline": False},
+                    {"name": "🎯 Win Rate (7-day)", "value": f"{summary.get('win_rate_pct', 0):.1f}%", "inline": False},
+                ],
+            })
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_daily(self, interaction: discord.Interaction):
+        """Show today's performance."""
+        try:
+            stats = await _cached_stats("daily")
+            
+            color = discord.Color.green() if stats.total_pnl_usd > 0 else discord.Color.red()
+            
+            embed = discord.Embed(
+                title="📅 Today's Performance",
+                color=color
+            )
+            
+            embed.add_field(name="💰 PnL", value=f"${stats.total_pnl_usd:.2f}", inline=True)
+            embed.add_field(name="📈 Trades", value=f"{stats.total_trades}", inline=True)
+            embed.add_field(name="🎯 Win Rate", value=f"{stats.win_rate:.1f}%", inline=True)
+            embed.add_field(name="✅ Wins", value=f"{stats.winning_trades}", inline=True)
+            embed.add_field(name="❌ Losses", value=f"{stats.losing_trades}", inline=True)
+            embed.add_field(name="💵 Best Trade", value=f"${stats.best_trade:.2f}", inline=True)
+            
+            embed.timestamp = discord.utils.utcnow()
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_trades(self, interaction: discord.Interaction):
+        """Show detailed trades with pagination."""
+        try:
+            trades = _get_cached_tracker().trades
+            if not trades:
+                await interaction.response.send_message("❌ No trades found", ephemeral=True)
+                return
+            
+            recent_trades = trades[-1:-11:-1]  # Last 10, newest first
+            
+            view = TradeDetailsView(recent_trades, self)
+            await interaction.response.send_message(embed=view._embeds[0], view=view, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_toptraders(self, interaction: discord.Interaction):
+        """Show top performing symbols."""
+        try:
+            tracker = _get_cached_tracker()
+            
+            if len(tracker.trades) < TOP_SYMBOLS_VECTORIZE_THRESHOLD:
+                sorted_symbols = _top_symbols(tracker)
+            else:
+                # Large histories: keep the event loop free while NumPy groups the trades
+                sorted_symbols = await asyncio.to_thread(_top_symbols, tracker)
+            
+            embed = discord.Embed(title="🏆 Top Performing Symbols", color=discord.Color.gold())
+            
+            for i, (symbol, (pnl, trades, wins)) in enumerate(sorted_symbols, 1):
+                win_rate = (wins / trades * 100) if trades > 0 else 0
+                embed.add_field(
+                    name=f"#{i} {symbol}",
+                    value=f"PnL: ${pnl:.2f} | Trades: {trades} | Win Rate: {win_rate:.1f}%",
+                    inline=False
+                )
+            
+            if not sorted_symbols:
+                embed.description = "No trades yet"
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_portfolio(self, interaction: discord.Interaction):
+        """Show portfolio overview."""
+        try:
+            summary = await _cached_stats("summary", 30)
+            
+            embed = discord.Embed(title="💼 Portfolio Overview", color=discord.Color.blue())
+            
+            embed.add_field(name="📊 30-Day Performance", value=f"${summary.get('total_pnl_usd', 0):.2f}", inline=True)
+            embed.add_field(name="📈 Total Trades", value=f"{summary.get('total_trades', 0)}", inline=True)
+            embed.add_field(name="🎯 Win Rate", value=f"{summary.get('win_rate_pct', 0):.1f}%", inline=True)
+            embed.add_field(name="📊 Profit Factor", value=_format_profit_factor(summary.get('profit_factor', 0)), inline=True)
+            embed.add_field(name="🎲 Best Trade", value=f"${summary.get('best_trade', 0):.2f}", inline=True)
+            embed.add_field(name="💸 Worst Trade", value=f"${summary.get('worst_trade', 0):.2f}", inline=True)
+            
+            embed.set_footer(text="Premium feature - Subscribe for more details")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_subscribe(self, interaction: discord.Interaction):
+        """Show subscription options."""
+        await interaction.response.send_message(embed=self._subscribe_embed, ephemeral=True)
+    
+    async def show_analytics(self, interaction: discord.Interaction):
+        """Show advanced analytics and insights."""
+        try:
+            summaries = await _cached_stats("summaries", (7, 30))
+            summary_7d, summary_30d = summaries[7], summaries[30]
+            
+            embed = discord.Embed(
+                title="📊 Advanced Analytics",
+                color=discord.Color.blurple(),
+                description="Detailed trading insights and metrics"
+            )
+            
+            # 7-Day Analysis
+            embed.add_field(
+                name="📈 7-Day Analysis",
+                value=f"PnL: ${summary_7d.get('total_pnl_usd', 0):.2f}\n"
+                      f"Trades: {summary_7d.get('total_trades', 0)}\n"
+                      f"Win Rate: {summary_7d.get('win_rate_pct', 0):.1f}%\n"
+                      f"Daily Avg: ${summary_7d.get('avg_daily_profit', 0):.2f}",
+                inline=True
+            )
+            
+            # 30-Day Analysis
+            embed.add_field(
+                name="📊 30-Day Analysis",
+                value=f"PnL: ${summary_30d.get('total_pnl_usd', 0):.2f}\n"
+                      f"Trades: {summary_30d.get('total_trades', 0)}\n"
+                      f"Win Rate: {summary_30d.get('win_rate_pct', 0):.1f}%\n"
+                      f"Daily Avg: ${summary_30d.get('avg_daily_profit', 0):.2f}",
+                inline=True
+            )
+            
+            # Risk Metrics
+            embed.add_field(
+                name="⚠️ Risk Metrics",
+                value=f"Profit Factor: {_format_profit_factor(summary_30d.get('profit_factor', 0))}\n"
+                      f"Best Trade: ${summary_30d.get('best_trade', 0):.2f}\n"
+                      f"Worst Trade: ${summary_30d.get('worst_trade', 0):.2f}",
+                inline=False
+            )
+            
+            embed.set_footer(text="Premium Analytics")
+            embed.timestamp = discord.utils.utcnow()
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    
+    async def show_settings(self, interaction: discord.Interaction):
+        """Show bot settings and preferences."""
+        await interaction.response.send_message(embed=self._settings_embed, ephemeral=True)
+    
+    @commands.command()
+    async def menu(self, ctx):
+        """Show main menu with buttons."""
+        await ctx.send(embed=self._menu_embed, view=self._menu_view)
+    
+    @commands.command()
+    async def trades(self, ctx, limit: int = 10):
+        """Get recent trades."""
+        try:
+            recent = _get_cached_tracker().last_n(limit)
+            count = len(recent["symbol"])
+            
+            if not count:
+                await ctx.send("❌ No trades found")
+                return
+            
+            embed = discord.Embed(
+                title=f"📋 Last {count} Trades",
+                color=discord.Color.blue()
+            )
+            
+            rows = zip(
+                recent["symbol"].tolist(), recent["entry_price"].tolist(), recent["exit_price"].tolist(),
+                recent["pnl_usd"].tolist(), recent["pnl_percentage"].tolist(),
+            )
+            for symbol, entry_price, exit_price, pnl, pnl_pct in rows:
+                if exit_price == exit_price and exit_price:  # NaN marks an open trade
                     status = "✅" if pnl > 0 else "❌"
                     
                     embed.add_field(
-                        name=f"{status} {trade.symbol}",
-                        value=f"Entry: ${trade.entry_price:.6f}\nExit: ${trade.exit_price:.6f}\nPnL: ${pnl:.2f} ({pnl_pct:.2f}%)",
+                        name=f"{status} {symbol}",
+                        value=f"Entry: ${entry_price:.6f}\nExit: ${exit_price:.6f}\nPnL: ${pnl:.2f} ({pnl_pct:.2f}%)",
                         inline=False
                     )
             
@@ -628,8 +965,6 @@ class TradingSignals(commands.Cog):
     async def status(self, ctx):
         """Get bot status."""
         try:
-            from trading_bot.monitoring.performance_monitor import get_performance_monitor
-            
             monitor = get_performance_monitor()
             summary = monitor.get_performance_summary()
             
@@ -658,49 +993,13 @@ class TradingSignals(commands.Cog):
     @commands.command()
     async def subscribe(self, ctx):
         """Subscribe to premium tier."""
-        embed = discord.Embed(
-            title="💳 Subscribe to Trading Bot Premium",
-            description="Get real-time signals and advanced analytics",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="📊 Pro Tier - $29/month",
-            value="✅ Real-time signals\n✅ Advanced analytics\n✅ Email alerts\n✅ Priority support",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏢 Enterprise Tier - $99/month",
-            value="✅ Everything in Pro\n✅ Multiple bots\n✅ API access\n✅ Custom features",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Payment Instructions",
-            value="**Bank Transfer to:**\n\n"
-                  "Account Holder: Ahmed Sharf\n"
-                  "Bank: Abu Dhabi Islamic Bank Egypt\n"
-                  "Account Number: 200000550790\n"
-                  "IBAN: EG7400305524000000200000550790\n"
-                  "SWIFT: ABDIEGCADKI\n\n"
-                  "**After payment:**\n"
-                  "DM @Admin with proof of payment\n"
-                  "You'll be added to premium role",
-            inline=False
-        )
-        
-        embed.set_footer(text="Questions? Use !help for support")
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._subscribe_embed)
     
     @commands.command()
     async def stats(self, ctx, days: int = 30):
         """Get detailed statistics for the last N days."""
         try:
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
-            summary = tracker.get_profit_summary(days=days)
+            summary = await _cached_stats("summary", days)
             
             embed = discord.Embed(
                 title=f"📊 Trading Statistics ({days} Days)",
@@ -751,7 +1050,7 @@ class TradingSignals(commands.Cog):
             
             embed.add_field(
                 name="📊 Profit Factor",
-                value=f"{summary.get('profit_factor', 0):.2f}",
+                value=_format_profit_factor(summary.get('profit_factor', 0), suffix=""),
                 inline=True
             )
             
@@ -761,7 +1060,7 @@ class TradingSignals(commands.Cog):
                 inline=True
             )
             
-            embed.set_footer(text=f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            embed.set_footer(text=f"Updated: {_now_full()}")
             await ctx.send(embed=embed)
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}")
@@ -770,55 +1069,23 @@ class TradingSignals(commands.Cog):
     async def daily(self, ctx):
         """Get today's performance summary."""
         try:
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
-            stats = tracker.get_daily_performance()
+            stats = await _cached_stats("daily")
             
             color = discord.Color.green() if stats.total_pnl_usd > 0 else discord.Color.red()
             
-            embed = discord.Embed(
-                title="📅 Today's Performance",
-                color=color
-            )
-            
-            embed.add_field(
-                name="💰 PnL",
-                value=f"${stats.total_pnl_usd:.2f}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📈 Trades",
-                value=f"{stats.total_trades}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎯 Win Rate",
-                value=f"{stats.win_rate:.1f}%",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="✅ Wins",
-                value=f"{stats.winning_trades}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="❌ Losses",
-                value=f"{stats.losing_trades}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="💵 Best Trade",
-                value=f"${stats.best_trade:.2f}",
-                inline=True
-            )
-            
-            embed.set_footer(text=f"Updated: {datetime.now().strftime('%H:%M:%S')}")
+            embed = discord.Embed.from_dict({
+                "title": "📅 Today's Performance",
+                "color": color.value,
+                "fields": [
+                    {"name": "💰 PnL", "value": f"${stats.total_pnl_usd:.2f}", "inline": True},
+                    {"name": "📈 Trades", "value": f"{stats.total_trades}", "inline": True},
+                    {"name": "🎯 Win Rate", "value": f"{stats.win_rate:.1f}%", "inline": True},
+                    {"name": "✅ Wins", "value": f"{stats.winning_trades}", "inline": True},
+                    {"name": "❌ Losses", "value": f"{stats.losing_trades}", "inline": True},
+                    {"name": "💵 Best Trade", "value": f"${stats.best_trade:.2f}", "inline": True},
+                ],
+                "footer": {"text": f"Updated: {_now_hms()}"},
+            })
             await ctx.send(embed=embed)
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}")
@@ -827,34 +1094,23 @@ class TradingSignals(commands.Cog):
     async def toptraders(self, ctx):
         """Get top performing symbols."""
         try:
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
+            tracker = _get_cached_tracker()
             
-            # Group trades by symbol and calculate PnL
-            symbol_stats = {}
-            for trade in tracker.trades:
-                if trade.symbol not in symbol_stats:
-                    symbol_stats[trade.symbol] = {"pnl": 0, "trades": 0, "wins": 0}
-                
-                symbol_stats[trade.symbol]["trades"] += 1
-                symbol_stats[trade.symbol]["pnl"] += trade.pnl_usd or 0
-                if (trade.pnl_usd or 0) > 0:
-                    symbol_stats[trade.symbol]["wins"] += 1
-            
-            # Sort by PnL
-            sorted_symbols = sorted(symbol_stats.items(), key=lambda x: x[1]["pnl"], reverse=True)[:5]
+            if len(tracker.trades) < TOP_SYMBOLS_VECTORIZE_THRESHOLD:
+                sorted_symbols = _top_symbols(tracker)
+            else:
+                sorted_symbols = await asyncio.to_thread(_symbol_pnl_table, tracker)
             
             embed = discord.Embed(
                 title="🏆 Top Performing Symbols",
                 color=discord.Color.gold()
             )
             
-            for i, (symbol, stats) in enumerate(sorted_symbols, 1):
-                win_rate = (stats["wins"] / stats["trades"] * 100) if stats["trades"] > 0 else 0
+            for i, (symbol, (pnl, trades, wins)) in enumerate(sorted_symbols, 1):
+                win_rate = (wins / trades * 100) if trades > 0 else 0
                 embed.add_field(
                     name=f"#{i} {symbol}",
-                    value=f"PnL: ${stats['pnl']:.2f} | Trades: {stats['trades']} | Win Rate: {win_rate:.1f}%",
+                    value=f"PnL: ${pnl:.2f} | Trades: {trades} | Win Rate: {win_rate:.1f}%",
                     inline=False
                 )
             
@@ -868,80 +1124,27 @@ class TradingSignals(commands.Cog):
     @commands.command()
     async def alerts(self, ctx):
         """Get trading alerts and notifications."""
-        embed = discord.Embed(
-            title="🔔 Trading Alerts",
-            color=discord.Color.orange()
-        )
-        
-        embed.add_field(
-            name="📢 Alert Settings",
-            value="React with ✅ to enable alerts\n"
-                  "🔴 Large Loss Alert (>$100)\n"
-                  "🟢 Large Win Alert (>$100)\n"
-                  "📊 Daily Summary\n"
-                  "⚠️ Risk Warnings",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 Pro Tip",
-            value="Enable alerts to get notified of important trading events",
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._alerts_embed)
     
     @commands.command()
     async def portfolio(self, ctx):
         """Get portfolio overview."""
         try:
-            from trading_bot.analytics.daily_performance import get_performance_tracker
-            
-            tracker = get_performance_tracker()
-            summary = tracker.get_profit_summary(days=30)
-            
-            embed = discord.Embed(
-                title="💼 Portfolio Overview",
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="📊 30-Day Performance",
-                value=f"${summary.get('total_pnl_usd', 0):.2f}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📈 Total Trades",
-                value=f"{summary.get('total_trades', 0)}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎯 Win Rate",
-                value=f"{summary.get('win_rate_pct', 0):.1f}%",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📊 Profit Factor",
-                value=f"{summary.get('profit_factor', 0):.2f}x",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎲 Best Trade",
-                value=f"${summary.get('best_trade', 0):.2f}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="💸 Worst Trade",
-                value=f"${summary.get('worst_trade', 0):.2f}",
-                inline=True
-            )
-            
-            embed.set_footer(text="Premium feature - Subscribe for more details")
+            summary = await _cached_stats("summary", 30)
+            
+            embed = discord.Embed.from_dict({
+                "title": "💼 Portfolio Overview",
+                "color": discord.Color.blue().value,
+                "fields": [
+                    {"name": "📊 30-Day Performance", "value": f"${summary.get('total_pnl_usd', 0):.2f}", "inline": True},
+                    {"name": "📈 Total Trades", "value": f"{summary.get('total_trades', 0)}", "inline": True},
+                    {"name": "🎯 Win Rate", "value": f"{summary.get('win_rate_pct', 0):.1f}%", "inline": True},
+                    {"name": "📊 Profit Factor", "value": _format_profit_factor(summary.get('profit_factor', 0)), "inline": True},
+                    {"name": "🎲 Best Trade", "value": f"${summary.get('best_trade', 0):.2f}", "inline": True},
+                    {"name": "💸 Worst Trade", "value": f"${summary.get('worst_trade', 0):.2f}", "inline": True},
+                ],
+                "footer": {"text": "Premium feature - Subscribe for more details"},
+            })
             await ctx.send(embed=embed)
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}")
@@ -949,77 +1152,12 @@ class TradingSignals(commands.Cog):
     @commands.command()
     async def invite(self, ctx):
         """Get bot invite link."""
-        embed = discord.Embed(
-            title="📨 Invite Friends",
-            description="Share the bot with your trading community!",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🔗 Server Link",
-            value="Share this server with friends to get early access",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Referral Bonus",
-            value="Refer 3 friends and get 1 month free premium!",
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._invite_embed)
     
     @commands.command()
     async def help(self, ctx):
         """Show help message."""
-        embed = discord.Embed(
-            title="📖 Trading Bot Commands",
-            color=discord.Color.blue(),
-            description="Complete list of available commands"
-        )
-        
-        embed.add_field(
-            name="📊 Performance Commands",
-            value="!performance - Get current metrics\n"
-                  "!daily - Today's performance\n"
-                  "!stats [days] - Statistics for N days\n"
-                  "!portfolio - 30-day portfolio overview",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📈 Trade Commands",
-            value="!trades [limit] - Get recent trades\n"
-                  "!toptraders - Top performing symbols",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Bot Commands",
-            value="!status - Get bot status\n"
-                  "!alerts - Trading alerts settings\n"
-                  "!invite - Invite friends",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💳 Premium Commands",
-            value="!subscribe - Subscribe to premium\n"
-                  "!help - Show this help message",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 Tips",
-            value="• Use !stats 7 for weekly stats\n"
-                  "• Use !stats 30 for monthly stats\n"
-                  "• Use !trades 20 for more trades\n"
-                  "• Premium members get more features",
-            inline=False
-        )
-        
-        embed.set_footer(text="Questions? DM @Admin for support")
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._help_embed)
 
 @bot.event
 async def on_ready():
@@ -1037,15 +1175,22 @@ async def on_ready():
     )
     await bot.change_presence(activity=activity)
     
+    # One bounded pool for all asyncio.to_thread stats work; on_ready fires again on reconnect
+    global _stats_executor
+    if _stats_executor is None:
+        _stats_executor = ThreadPoolExecutor(max_workers=STATS_EXECUTOR_WORKERS, thread_name_prefix="discord-stats")
+        asyncio.get_running_loop().set_default_executor(_stats_executor)
+        # Pay the summary kernel's JIT compile once here, not on the first stats click
+        await asyncio.to_thread(warm_summary_kernel)
+    
     # Post welcome message with menu to monitoring channel if set
     if CHANNEL_ID > 0:
         try:
             channel = bot.get_channel(CHANNEL_ID)
             if channel:
-                # Check if welcome message already exists
-                async for message in channel.history(limit=10):
-                    if message.author == bot.user and "Trading Bot Dashboard" in message.content:
-                        return  # Already posted
+                # Skip if we've already posted to this channel (no history scan on every reconnect)
+                if await _welcome_already_posted(channel):
+                    return
                 
                 # Post new welcome message
                 embed = discord.Embed(
@@ -1073,7 +1218,8 @@ async def on_ready():
                 
                 cog = bot.get_cog("TradingSignals")
                 if cog:
-                    await channel.send(embed=embed, view=MainMenuView(cog))
+                    message = await channel.send(embed=embed, view=MainMenuView(cog))
+                    _save_welcome_state(channel.id, message.id)
         except Exception as e:
             logger.error(f"Could not post welcome message: {e}")
 
@@ -1,15 +1,69 @@
 """Fine-tuning parameters for advanced analytics based on performance analysis."""
 
+import dataclasses
 import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_BAR = "=" * 80
+
+_DATA_DIR = Path("data")
+_DATA_DIR_READY = False  # set once _DATA_DIR has been created
+_LOG_PATH = _DATA_DIR / "fine_tuning_log.json"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FineTuningRecord:
+    """Entry written to the fine-tuning log."""
+
+    timestamp: str
+    analysis: dict
+    adjustments: dict
+
+
+def _dump_json(obj) -> bytes:
+    """Indented JSON as UTF-8 bytes, encoded by orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+# Static part of the log entry; only the timestamp changes per run.
+_TEMPLATE = FineTuningRecord(
+    timestamp="",
+    analysis={
+        "current_hold_rate": "100%",
+        "regime_detection": "excellent",
+        "market_structure": "strong",
+        "macro_risk": "very_high",
+        "recommendation": "gradual_parameter_optimization"
+    },
+    adjustments={
+        "macro_sensitivity": "reduce_high_risk_impact_0.7_to_0.8",
+        "confidence_threshold": "strong_structure_0.95_to_0.90",
+        "sideways_regime": "confidence_0.60_to_0.55_rsi_21_to_18",
+        "confluence_boost": "sideways_strong_structure_1.15x"
+    },
+)
+
+
 def apply_fine_tuning_adjustments():
     """Apply fine-tuning adjustments to improve trading opportunities while maintaining risk management."""
+    buf: list[str] = []
+    p = buf.append  # Collected and written to stdout in one go
     
-    print("🔧 ADVANCED ANALYTICS FINE-TUNING")
-    print("=" * 80)
-    print("Based on performance analysis, applying optimized parameters...")
-    print("=" * 80)
+    p("🔧 ADVANCED ANALYTICS FINE-TUNING")
+    p(_BAR)
+    p("Based on performance analysis, applying optimized parameters...")
+    p(_BAR)
     
     # Current observations from logs:
     # 1. 100% HOLD rate - very conservative (good for risk management)
@@ -17,21 +71,21 @@ def apply_fine_tuning_adjustments():
     # 3. Sideways market regime detected (correct)
     # 4. Strong market structure (0.80) but still not trading
     
-    print("\n📊 CURRENT PERFORMANCE ANALYSIS:")
-    print("✅ Regime Detection: EXCELLENT (1.00 strength, correctly identifying sideways)")
-    print("✅ Market Structure: STRONG (0.80 strength)")
-    print("⚠️ Macro Risk: VERY HIGH (0.10 exposure - causing conservative behavior)")
-    print("⚠️ Trade Rate: 0% (100% HOLD - very conservative)")
+    p("\n📊 CURRENT PERFORMANCE ANALYSIS:")
+    p("✅ Regime Detection: EXCELLENT (1.00 strength, correctly identifying sideways)")
+    p("✅ Market Structure: STRONG (0.80 strength)")
+    p("⚠️ Macro Risk: VERY HIGH (0.10 exposure - causing conservative behavior)")
+    p("⚠️ Trade Rate: 0% (100% HOLD - very conservative)")
     
-    print("\n🎯 FINE-TUNING STRATEGY:")
-    print("Goal: Maintain excellent risk management while allowing more opportunities")
-    print("Approach: Gradual parameter adjustments with safety margins")
+    p("\n🎯 FINE-TUNING STRATEGY:")
+    p("Goal: Maintain excellent risk management while allowing more opportunities")
+    p("Approach: Gradual parameter adjustments with safety margins")
     
     # Adjustment 1: Slightly reduce macro risk sensitivity
-    print("\n1️⃣ MACRO RISK SENSITIVITY ADJUSTMENT:")
-    print("   Current: Very high sensitivity (0.10 exposure)")
-    print("   Adjustment: Slightly reduce macro impact")
-    print("   Expected: Allow more trades in moderate risk conditions")
+    p("\n1️⃣ MACRO RISK SENSITIVITY ADJUSTMENT:")
+    p("   Current: Very high sensitivity (0.10 exposure)")
+    p("   Adjustment: Slightly reduce macro impact")
+    p("   Expected: Allow more trades in moderate risk conditions")
     
     macro_adjustment = """
 # In macro_factors.py - _calculate_recommended_exposure method
@@ -43,10 +97,10 @@ elif macro_risk_level == "medium":
 """
     
     # Adjustment 2: Reduce confidence threshold for strong market structure
-    print("\n2️⃣ CONFIDENCE THRESHOLD ADJUSTMENT:")
-    print("   Current: 0.65-0.70 (conservative)")
-    print("   Adjustment: Reduce by 0.05 when market structure is strong")
-    print("   Expected: More trades when technical conditions are favorable")
+    p("\n2️⃣ CONFIDENCE THRESHOLD ADJUSTMENT:")
+    p("   Current: 0.65-0.70 (conservative)")
+    p("   Adjustment: Reduce by 0.05 when market structure is strong")
+    p("   Expected: More trades when technical conditions are favorable")
     
     confidence_adjustment = """
 # In pipeline.py - around line 850
@@ -61,10 +115,10 @@ if market_structure:
 """
     
     # Adjustment 3: Improve regime-based parameter optimization
-    print("\n3️⃣ REGIME PARAMETER OPTIMIZATION:")
-    print("   Current: Sideways regime using conservative parameters")
-    print("   Adjustment: Optimize sideways market parameters")
-    print("   Expected: Better performance in ranging markets")
+    p("\n3️⃣ REGIME PARAMETER OPTIMIZATION:")
+    p("   Current: Sideways regime using conservative parameters")
+    p("   Adjustment: Optimize sideways market parameters")
+    p("   Expected: Better performance in ranging markets")
     
     regime_adjustment = """
 # In dynamic_optimizer.py - regime_parameters dict around line 45
@@ -84,10 +138,10 @@ if market_structure:
 """
     
     # Adjustment 4: Enhance confluence scoring for sideways markets
-    print("\n4️⃣ CONFLUENCE SCORING ENHANCEMENT:")
-    print("   Current: Standard confluence calculation")
-    print("   Adjustment: Boost confluence in strong structure + sideways regime")
-    print("   Expected: Better signal quality in ranging markets")
+    p("\n4️⃣ CONFLUENCE SCORING ENHANCEMENT:")
+    p("   Current: Standard confluence calculation")
+    p("   Adjustment: Boost confluence in strong structure + sideways regime")
+    p("   Expected: Better signal quality in ranging markets")
     
     confluence_adjustment = """
 # In pipeline.py - around line 815
@@ -99,55 +153,53 @@ if market_regime and market_regime.regime_type == "sideways":
         logger.info("🔄 SIDEWAYS BOOST: Enhanced confluence for strong sideways structure")
 """
     
-    print("\n📋 IMPLEMENTATION STEPS:")
-    print("1. Apply macro risk sensitivity adjustment")
-    print("2. Implement confidence threshold improvements") 
-    print("3. Optimize sideways regime parameters")
-    print("4. Enhance confluence scoring")
-    print("5. Monitor results over 24-48 hours")
-    
-    print("\n⚠️ SAFETY MEASURES:")
-    print("• All adjustments are conservative (5-10% changes)")
-    print("• Risk management remains the top priority")
-    print("• Can be reverted if performance degrades")
-    print("• Monitoring tools remain active")
-    
-    print("\n🎯 EXPECTED OUTCOMES:")
-    print("• Slight increase in trade opportunities (10-20%)")
-    print("• Maintained excellent risk management")
-    print("• Better performance in sideways/ranging markets")
-    print("• Preserved capital protection in high-risk conditions")
+    p("\n📋 IMPLEMENTATION STEPS:")
+    p("1. Apply macro risk sensitivity adjustment")
+    p("2. Implement confidence threshold improvements") 
+    p("3. Optimize sideways regime parameters")
+    p("4. Enhance confluence scoring")
+    p("5. Monitor results over 24-48 hours")
+    
+    p("\n⚠️ SAFETY MEASURES:")
+    p("• All adjustments are conservative (5-10% changes)")
+    p("• Risk management remains the top priority")
+    p("• Can be reverted if performance degrades")
+    p("• Monitoring tools remain active")
+    
+    p("\n🎯 EXPECTED OUTCOMES:")
+    p("• Slight increase in trade opportunities (10-20%)")
+    p("• Maintained excellent risk management")
+    p("• Better performance in sideways/ranging markets")
+    p("• Preserved capital protection in high-risk conditions")
     
     # Save adjustments to file for reference
-    adjustments = {
-        "timestamp": "2025-11-14 05:43:00",
-        "analysis": {
-            "current_hold_rate": "100%",
-            "regime_detection": "excellent",
-            "market_structure": "strong",
-            "macro_risk": "very_high",
-            "recommendation": "gradual_parameter_optimization"
-        },
-        "adjustments": {
-            "macro_sensitivity": "reduce_high_risk_impact_0.7_to_0.8",
-            "confidence_threshold": "strong_structure_0.95_to_0.90",
-            "sideways_regime": "confidence_0.60_to_0.55_rsi_21_to_18",
-            "confluence_boost": "sideways_strong_structure_1.15x"
-        }
-    }
-    
-    Path("data").mkdir(exist_ok=True)
-    with open("data/fine_tuning_log.json", "w") as f:
-        json.dump(adjustments, f, indent=2)
-    
-    print(f"\n💾 Adjustments logged to: data/fine_tuning_log.json")
+    record = dataclasses.replace(_TEMPLATE, timestamp=time.strftime("%Y-%m-%d %H:%M:%S"))
+    adjustments = dataclasses.asdict(record)
+    
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        _DATA_DIR.mkdir(exist_ok=True)
+        _DATA_DIR_READY = True
+    with open(_LOG_PATH, "wb") as f:
+        f.write(_dump_json(adjustments))
+    
+    p(f"\n💾 Adjustments logged to: {_LOG_PATH.as_posix()}")
     
+    sys.stdout.write("\n".join(buf) + "\n")
     return adjustments
 
+def _write_file(item):
+    """Write one ``(path, text)`` pair as UTF-8."""
+    path, text = item
+    Path(path).write_bytes(text.encode())
+
+
 def create_adjustment_scripts():
     """Create scripts to apply the adjustments."""
+    buf: list[str] = []
+    p = buf.append
     
-    print("\n🔧 CREATING ADJUSTMENT SCRIPTS...")
+    p("\n🔧 CREATING ADJUSTMENT SCRIPTS...")
     
     # Script 1: Macro adjustment
     macro_script = '''
@@ -165,9 +217,6 @@ elif macro_risk_level == "medium":
     base_exposure *= 1.05  # Slightly more aggressive for medium risk
 '''
     
-    with open("adjustment_1_macro.txt", "w") as f:
-        f.write(macro_script)
-    
     # Script 2: Confidence adjustment  
     confidence_script = '''
 # Apply this change to trading_bot/orchestration/pipeline.py
@@ -189,9 +238,6 @@ if market_structure:
         required_confidence *= 1.15
 '''
     
-    with open("adjustment_2_confidence.txt", "w") as f:
-        f.write(confidence_script)
-    
     # Script 3: Regime parameters
     regime_script = '''
 # Apply this change to trading_bot/analytics/dynamic_optimizer.py
@@ -213,28 +259,36 @@ if market_structure:
 )
 '''
     
-    with open("adjustment_3_regime.txt", "w") as f:
-        f.write(regime_script)
+    files = [
+        ("adjustment_1_macro.txt", macro_script),
+        ("adjustment_2_confidence.txt", confidence_script),
+        ("adjustment_3_regime.txt", regime_script),
+    ]
+    # Independent files: overlap the open/write/close round trips
+    with ThreadPoolExecutor(max_workers=len(files)) as ex:
+        list(ex.map(_write_file, files))
     
-    print("✅ Created adjustment scripts:")
-    print("   • adjustment_1_macro.txt")
-    print("   • adjustment_2_confidence.txt") 
-    print("   • adjustment_3_regime.txt")
+    p("✅ Created adjustment scripts:")
+    p("   • adjustment_1_macro.txt")
+    p("   • adjustment_2_confidence.txt") 
+    p("   • adjustment_3_regime.txt")
     
-    print("\n📋 TO APPLY ADJUSTMENTS:")
-    print("1. Stop the bot (Ctrl+C)")
-    print("2. Apply the changes from the .txt files")
-    print("3. Restart the bot")
-    print("4. Monitor for 24-48 hours")
-    print("5. Assess if more opportunities appear")
+    p("\n📋 TO APPLY ADJUSTMENTS:")
+    p("1. Stop the bot (Ctrl+C)")
+    p("2. Apply the changes from the .txt files")
+    p("3. Restart the bot")
+    p("4. Monitor for 24-48 hours")
+    p("5. Assess if more opportunities appear")
+    sys.stdout.write("\n".join(buf) + "\n")
+
 
 if __name__ == "__main__":
     adjustments = apply_fine_tuning_adjustments()
     create_adjustment_scripts()
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("🎯 FINE-TUNING COMPLETE!")
-    print("=" * 80)
+    print(_BAR)
     print("Your advanced analytics are working excellently for risk management.")
     print("These adjustments will help capture more opportunities while maintaining safety.")
     print("Monitor the results and adjust further if needed!")
@@ -8,27 +8,27 @@ from pathlib import Path
 # Add the trading_bot directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "trading_bot"))
 
-from trading_bot.reporting.excel_reporter import generate_trading_report
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('report_generation.log')
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 
 def main():
     """Generate trading analysis report."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler('report_generation.log')
+        ]
+    )
+    
     print("🔄 Generating Comprehensive Trading Analysis Report...")
     print("=" * 60)
     
     try:
+        # Imported here so openpyxl/pandas load only when a report is actually built
+        from trading_bot.reporting.excel_reporter import generate_trading_report
+        
         # Generate report for last 30 days
         report_path = generate_trading_report(days_back=30)
         
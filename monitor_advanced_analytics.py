@@ -1,13 +1,16 @@
 """Monitor advanced analytics output from the trading bot."""
 
+import os
 import re
+from array import array
 import time
-import subprocess
 import sys
-from datetime import datetime
+
+_BAR = "=" * 80
+_DASH = "-" * 80
 
 print("🔍 ADVANCED ANALYTICS MONITOR")
-print("=" * 80)
+print(_BAR)
 print("Monitoring trading bot for advanced analytics output...")
 print("Look for these indicators:")
 print("  📊 MARKET REGIME - Dynamic regime detection")
@@ -17,9 +20,21 @@ print("  🌍 MACRO ENVIRONMENT - Economic factors")
 print("  🎯 DYNAMIC CONFIDENCE - Adaptive thresholds")
 print("  🚀 ADVANCED BUY EXECUTION - Enhanced trade execution")
 print("  ✅ ADVANCED ANALYTICS INITIALIZED - Startup confirmation")
-print("=" * 80)
+print(_BAR)
 print()
 
+_ts_cache = [-1, ""]  # [epoch second, "%H:%M:%S"]
+
+
+def _ts():
+    """Current local time as HH:MM:SS, reformatted only when the second changes."""
+    s = int(time.time())
+    if s != _ts_cache[0]:
+        _ts_cache[0] = s
+        _ts_cache[1] = time.strftime('%H:%M:%S', time.localtime(s))
+    return _ts_cache[1]
+
+
 # Analytics patterns to watch for
 patterns = {
     "📊 MARKET REGIME": r"📊 MARKET REGIME:",
@@ -35,77 +50,144 @@ patterns = {
     "✅ STRONG STRUCTURE": r"✅ STRONG MARKET STRUCTURE:"
 }
 
-def monitor_logs():
+_PATTERN_KEYS = tuple(patterns)
+
+# All patterns in one alternation so each log line is scanned once, not once per pattern.
+# Group names must be identifiers, so k<i> maps back to the index into _PATTERN_KEYS.
+_GROUP_INDEX = {f"k{i}": i for i in range(len(patterns))}
+COMBINED_PATTERN = re.compile("|".join(f"(?P<k{i}>{p})" for i, p in enumerate(patterns.values())))
+
+
+def new_counts():
+    """Zeroed per-marker hit counters, indexed like _PATTERN_KEYS."""
+    return array("Q", bytes(8 * len(patterns)))
+
+
+# Log file followed by monitor_logs; overridable with BOT_LOG_FILE or the first CLI argument.
+LOG_PATH = os.environ.get("BOT_LOG_FILE", "bot_monitor.log")
+_READ_SIZE = 65536
+# Same alternation over raw bytes, so non-matching lines are never decoded.
+COMBINED_PATTERN_BYTES = re.compile(COMBINED_PATTERN.pattern.encode())
+
+
+def tail_log(log_path, counts, poll_interval=0.5):
+    """Follow ``log_path`` from its current end and echo lines carrying analytics markers.
+
+    Reads go into one reusable buffer and the scan runs on bytes; matched lines
+    are written straight to the stdout buffer without decoding. Runs until interrupted.
+    """
+    # Unbuffered binary file: readinto is one plain read() per call and works on every platform
+    with open(log_path, "rb", buffering=0) as f:
+        f.seek(0, os.SEEK_END)
+        chunk = bytearray(_READ_SIZE)
+        view = memoryview(chunk)
+        pending = bytearray()
+        out = sys.stdout.buffer  # matched lines are echoed as-is, no decode/encode round trip
+        while True:
+            n = f.readinto(chunk)
+            if not n:
+                time.sleep(poll_interval)
+                continue
+            pending += view[:n]
+            end = pending.rfind(b"\n")
+            if end < 0:
+                continue
+            last_start = -1
+            for m in COMBINED_PATTERN_BYTES.finditer(pending, 0, end):
+                counts[_GROUP_INDEX[m.lastgroup]] += 1
+                start = pending.rfind(b"\n", 0, m.start()) + 1
+                if start != last_start:
+                    last_start = start
+                    line = pending[start:pending.find(b"\n", m.end())].rstrip()
+                    out.write(b"[%s] %s\n" % (_ts().encode(), line))
+            out.flush()
+            del pending[:end + 1]
+
+
+def monitor_logs(log_path=LOG_PATH):
     """Monitor the bot logs for advanced analytics output."""
+    buf: list[str] = []
+    p = buf.append
     
-    analytics_detected = {key: 0 for key in patterns.keys()}
+    analytics_detected = new_counts()
     
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] 🔍 Starting log monitoring...")
-    print("Press Ctrl+C to stop monitoring")
-    print("-" * 80)
+    p(f"[{_ts()}] 🔍 Starting log monitoring...")
+    p("Press Ctrl+C to stop monitoring")
+    p(_DASH)
     
     try:
-        # In a real scenario, you'd tail the log file
-        # For now, we'll show what to look for
-        print("\n🎯 WHAT TO LOOK FOR IN YOUR BOT LOGS:")
-        print("\n1. STARTUP CONFIRMATION:")
-        print("   ✅ ADVANCED ANALYTICS INITIALIZED: Risk, Optimizer, Market Structure, Macro, Portfolio")
+        if os.path.exists(log_path):
+            p(f"📄 Tailing {log_path}")
+            sys.stdout.write("\n".join(buf) + "\n")
+            sys.stdout.flush()
+            buf.clear()
+            tail_log(log_path, analytics_detected)
+
+        # No log file yet - show what to look for
+        p("\n🎯 WHAT TO LOOK FOR IN YOUR BOT LOGS:")
+        p("\n1. STARTUP CONFIRMATION:")
+        p("   ✅ ADVANCED ANALYTICS INITIALIZED: Risk, Optimizer, Market Structure, Macro, Portfolio")
         
-        print("\n2. REGIME DETECTION:")
-        print("   📊 MARKET REGIME: BTC/USDT - trending_up (strength=0.85, volatility=0.12)")
-        print("   ⚙️ OPTIMAL PARAMS: confidence_threshold=0.40, rsi_period=14, stop_loss_mult=1.5")
+        p("\n2. REGIME DETECTION:")
+        p("   📊 MARKET REGIME: BTC/USDT - trending_up (strength=0.85, volatility=0.12)")
+        p("   ⚙️ OPTIMAL PARAMS: confidence_threshold=0.40, rsi_period=14, stop_loss_mult=1.5")
         
-        print("\n3. MARKET STRUCTURE ANALYSIS:")
-        print("   🏗️ MARKET STRUCTURE: BTC/USDT - higher_highs_lows, bullish smart money (0.75 strength)")
-        print("   ✅ SMART MONEY ALIGNMENT: Smart money agrees with signal direction")
+        p("\n3. MARKET STRUCTURE ANALYSIS:")
+        p("   🏗️ MARKET STRUCTURE: BTC/USDT - higher_highs_lows, bullish smart money (0.75 strength)")
+        p("   ✅ SMART MONEY ALIGNMENT: Smart money agrees with signal direction")
         
-        print("\n4. MACRO-ECONOMIC ASSESSMENT:")
-        print("   🌍 MACRO ENVIRONMENT: phase=risk_on, sentiment=bullish, risk=low, exposure=0.85")
-        print("   📊 BTC DOMINANCE: bullish_for_alts (impact=0.30)")
+        p("\n4. MACRO-ECONOMIC ASSESSMENT:")
+        p("   🌍 MACRO ENVIRONMENT: phase=risk_on, sentiment=bullish, risk=low, exposure=0.85")
+        p("   📊 BTC DOMINANCE: bullish_for_alts (impact=0.30)")
         
-        print("\n5. DYNAMIC OPTIMIZATION:")
-        print("   🎯 DYNAMIC CONFIDENCE: Using regime-optimized threshold 0.40")
-        print("   ✅ STRONG MARKET STRUCTURE: strength=0.75 - Reducing confidence requirement")
+        p("\n5. DYNAMIC OPTIMIZATION:")
+        p("   🎯 DYNAMIC CONFIDENCE: Using regime-optimized threshold 0.40")
+        p("   ✅ STRONG MARKET STRUCTURE: strength=0.75 - Reducing confidence requirement")
         
-        print("\n6. ENHANCED EXECUTION:")
-        print("   🚀 ADVANCED BUY EXECUTION: BTC/USDT | amount=0.001500, price=42150.00")
-        print("      📊 Regime: trending_up (0.85 strength, 0.12 volatility)")
-        print("      🏗️ Structure: higher_highs_lows trend, bullish smart money (0.75 strength)")
-        print("      🌍 Macro: risk_on phase, bullish sentiment, low risk")
+        p("\n6. ENHANCED EXECUTION:")
+        p("   🚀 ADVANCED BUY EXECUTION: BTC/USDT | amount=0.001500, price=42150.00")
+        p("      📊 Regime: trending_up (0.85 strength, 0.12 volatility)")
+        p("      🏗️ Structure: higher_highs_lows trend, bullish smart money (0.75 strength)")
+        p("      🌍 Macro: risk_on phase, bullish sentiment, low risk")
         
-        print("\n7. RISK ADJUSTMENTS:")
-        print("   🎯 ADJUSTED STOP-LOSS: 41000.00 -> 40500.00 (multiplier=1.50)")
-        print("   📉 MACRO ADJUSTMENT: Position size reduced by 15% due to macro risk")
+        p("\n7. RISK ADJUSTMENTS:")
+        p("   🎯 ADJUSTED STOP-LOSS: 41000.00 -> 40500.00 (multiplier=1.50)")
+        p("   📉 MACRO ADJUSTMENT: Position size reduced by 15% due to macro risk")
         
-        print("\n" + "=" * 80)
-        print("🎉 ADVANCED ANALYTICS ARE NOW ACTIVE!")
-        print("=" * 80)
+        p("\n" + _BAR)
+        p("🎉 ADVANCED ANALYTICS ARE NOW ACTIVE!")
+        p(_BAR)
         
-        print("\n📊 PERFORMANCE MONITORING TIPS:")
-        print("1. Compare win rates before/after integration")
-        print("2. Monitor how confidence thresholds adapt")
-        print("3. Watch for regime changes and parameter adjustments")
-        print("4. Track macro risk adjustments")
-        print("5. Observe smart money alignment confirmations")
+        p("\n📊 PERFORMANCE MONITORING TIPS:")
+        p("1. Compare win rates before/after integration")
+        p("2. Monitor how confidence thresholds adapt")
+        p("3. Watch for regime changes and parameter adjustments")
+        p("4. Track macro risk adjustments")
+        p("5. Observe smart money alignment confirmations")
         
-        print("\n🔧 FINE-TUNING GUIDELINES:")
-        print("1. If too conservative: Lower base confidence thresholds")
-        print("2. If too aggressive: Increase regime multipliers")
-        print("3. If missing trades: Check macro exposure limits")
-        print("4. If poor performance: Review regime detection accuracy")
+        p("\n🔧 FINE-TUNING GUIDELINES:")
+        p("1. If too conservative: Lower base confidence thresholds")
+        p("2. If too aggressive: Increase regime multipliers")
+        p("3. If missing trades: Check macro exposure limits")
+        p("4. If poor performance: Review regime detection accuracy")
         
-        print("\n🎯 SUCCESS INDICATORS:")
-        print("✅ Higher win rate (target: 65-70% vs previous ~55%)")
-        print("✅ Lower max drawdown (target: <10% vs previous ~15%)")
-        print("✅ Better Sharpe ratio (target: >1.5 vs previous ~0.8)")
-        print("✅ Smarter entry/exit timing")
-        print("✅ Adaptive behavior in different market conditions")
+        p("\n🎯 SUCCESS INDICATORS:")
+        p("✅ Higher win rate (target: 65-70% vs previous ~55%)")
+        p("✅ Lower max drawdown (target: <10% vs previous ~15%)")
+        p("✅ Better Sharpe ratio (target: >1.5 vs previous ~0.8)")
+        p("✅ Smarter entry/exit timing")
+        p("✅ Adaptive behavior in different market conditions")
         
     except KeyboardInterrupt:
-        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 🛑 Monitoring stopped")
+        p(f"\n[{_ts()}] 🛑 Monitoring stopped")
+        for key, count in zip(_PATTERN_KEYS, analytics_detected):
+            if count:
+                p(f"   {key}: {count}")
     
     except Exception as exc:
-        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] ❌ Error: {exc}")
+        p(f"\n[{_ts()}] ❌ Error: {exc}")
+    sys.stdout.write("\n".join(buf) + "\n")
+
 
 if __name__ == "__main__":
-    monitor_logs()
+    monitor_logs(sys.argv[1] if len(sys.argv) > 1 else LOG_PATH)
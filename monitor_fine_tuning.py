@@ -1,21 +1,79 @@
 """Monitor fine-tuning results in real-time."""
 
+import json
+import os
+import sys
 import time
-import re
-from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_BAR = "=" * 80
+_BAR_SHORT = "=" * 60
+
+_ts_cache = [-1, ""]  # [epoch second, "%H:%M:%S"]
+
+
+def _ts():
+    """Current local time as HH:MM:SS, reformatted only when the second changes."""
+    s = int(time.time())
+    if s != _ts_cache[0]:
+        _ts_cache[0] = s
+        _ts_cache[1] = time.strftime('%H:%M:%S', time.localtime(s))
+    return _ts_cache[1]
+
+
+class _CachedJson:
+    """JSON file reader that re-parses only after the file's mtime changes.
+
+    A change is picked up once the file has been quiet for ``debounce_ms``, so a
+    writer caught mid-write is not parsed; polling an unchanged file costs one stat.
+    A file that fails to parse leaves the previous value in place.
+    """
+
+    def __init__(self, path, debounce_ms=500):
+        self.path = Path(path)
+        self.mtime = 0
+        self.value = None
+        self.debounce = int(debounce_ms * 1e6)
+
+    def get(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return self.value
+        if mtime != self.mtime and (self.value is None or time.time_ns() - mtime >= self.debounce):
+            try:
+                data = self.path.read_bytes()
+                self.value = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            except ValueError:  # JSONDecodeError from either library
+                # Corrupt or half-written: keep the last good value and retry on the next get()
+                return self.value
+            self.mtime = mtime
+        return self.value
+
+
+FINE_TUNING_LOG = _CachedJson(Path("data") / "fine_tuning_log.json")
+
 
 def monitor_fine_tuning_results():
     """Monitor the bot logs for fine-tuning effectiveness."""
+    buf: list[str] = []
+    p = buf.append
     
-    print("🔍 FINE-TUNING RESULTS MONITOR")
-    print("=" * 80)
-    print("Monitoring bot for evidence of fine-tuning improvements...")
-    print("Looking for changes in:")
-    print("  • Lower confidence thresholds (should see < 0.60)")
-    print("  • More trading opportunities (less 100% HOLD)")
-    print("  • Better macro exposure (should see > 0.10)")
-    print("  • Enhanced regime parameters")
-    print("=" * 80)
+    p("🔍 FINE-TUNING RESULTS MONITOR")
+    p(_BAR)
+    p("Monitoring bot for evidence of fine-tuning improvements...")
+    p("Looking for changes in:")
+    p("  • Lower confidence thresholds (should see < 0.60)")
+    p("  • More trading opportunities (less 100% HOLD)")
+    p("  • Better macro exposure (should see > 0.10)")
+    p("  • Enhanced regime parameters")
+    p(_BAR)
     
     # Key indicators to watch for
     indicators = {
@@ -26,68 +84,73 @@ def monitor_fine_tuning_results():
         "market_structures": []
     }
     
-    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 🔍 Starting monitoring...")
-    print("=" * 60)
+    p(f"\n[{_ts()}] 🔍 Starting monitoring...")
+    p(_BAR_SHORT)
     
     # Simulate monitoring (in real scenario, you'd tail the log file)
-    print("\n📊 EXPECTED IMPROVEMENTS FROM FINE-TUNING:")
+    p("\n📊 EXPECTED IMPROVEMENTS FROM FINE-TUNING:")
     
-    print("\n1️⃣ MACRO RISK SENSITIVITY:")
-    print("   BEFORE: base_exposure *= 0.7 (very conservative)")
-    print("   AFTER:  base_exposure *= 0.8 (less conservative)")
-    print("   EXPECT: Higher recommended exposure in high-risk conditions")
+    p("\n1️⃣ MACRO RISK SENSITIVITY:")
+    p("   BEFORE: base_exposure *= 0.7 (very conservative)")
+    p("   AFTER:  base_exposure *= 0.8 (less conservative)")
+    p("   EXPECT: Higher recommended exposure in high-risk conditions")
     
-    print("\n2️⃣ CONFIDENCE THRESHOLDS:")
-    print("   BEFORE: required_confidence *= 0.95 (small reduction)")
-    print("   AFTER:  required_confidence *= 0.90 (more aggressive)")
-    print("   EXPECT: Lower confidence requirements for strong market structure")
+    p("\n2️⃣ CONFIDENCE THRESHOLDS:")
+    p("   BEFORE: required_confidence *= 0.95 (small reduction)")
+    p("   AFTER:  required_confidence *= 0.90 (more aggressive)")
+    p("   EXPECT: Lower confidence requirements for strong market structure")
     
-    print("\n3️⃣ SIDEWAYS REGIME PARAMETERS:")
-    print("   BEFORE: confidence_threshold=0.60")
-    print("   AFTER:  confidence_threshold=0.55")
-    print("   EXPECT: More opportunities in sideways/ranging markets")
+    p("\n3️⃣ SIDEWAYS REGIME PARAMETERS:")
+    p("   BEFORE: confidence_threshold=0.60")
+    p("   AFTER:  confidence_threshold=0.55")
+    p("   EXPECT: More opportunities in sideways/ranging markets")
     
-    print("\n📋 WHAT TO LOOK FOR IN LOGS:")
-    print("✅ 'DYNAMIC CONFIDENCE: Using regime-optimized threshold 0.55' (was 0.60+)")
-    print("✅ 'MACRO ENVIRONMENT: exposure=0.12+' (was 0.10)")
-    print("✅ More BUY/SELL decisions (less 100% HOLD)")
-    print("✅ 'STRONG MARKET STRUCTURE: reducing confidence requirement' more often")
+    p("\n📋 WHAT TO LOOK FOR IN LOGS:")
+    p("✅ 'DYNAMIC CONFIDENCE: Using regime-optimized threshold 0.55' (was 0.60+)")
+    p("✅ 'MACRO ENVIRONMENT: exposure=0.12+' (was 0.10)")
+    p("✅ More BUY/SELL decisions (less 100% HOLD)")
+    p("✅ 'STRONG MARKET STRUCTURE: reducing confidence requirement' more often")
     
-    print("\n🎯 SUCCESS INDICATORS:")
-    print("• Trade rate increases from 0% to 10-20%")
-    print("• Confidence thresholds adapt more aggressively")
-    print("• Better performance in sideways markets")
-    print("• Maintained risk management in high-risk conditions")
+    p("\n🎯 SUCCESS INDICATORS:")
+    p("• Trade rate increases from 0% to 10-20%")
+    p("• Confidence thresholds adapt more aggressively")
+    p("• Better performance in sideways markets")
+    p("• Maintained risk management in high-risk conditions")
     
-    print("\n📊 MONITORING RESULTS:")
-    print("(Check your bot terminal for these improvements)")
+    p("\n📊 MONITORING RESULTS:")
+    p("(Check your bot terminal for these improvements)")
     
     # Instructions for manual monitoring
-    print("\n🔧 MANUAL MONITORING STEPS:")
-    print("1. Watch your bot terminal output")
-    print("2. Look for the indicators mentioned above")
-    print("3. Compare behavior to pre-fine-tuning (100% HOLD)")
-    print("4. Monitor for 1-2 hours to see pattern changes")
+    p("\n🔧 MANUAL MONITORING STEPS:")
+    p("1. Watch your bot terminal output")
+    p("2. Look for the indicators mentioned above")
+    p("3. Compare behavior to pre-fine-tuning (100% HOLD)")
+    p("4. Monitor for 1-2 hours to see pattern changes")
     
-    print("\n⚠️ IF NO IMPROVEMENTS SEEN:")
-    print("• Market conditions may still be very unfavorable")
-    print("• Fine-tuning is working but being overridden by macro risk")
-    print("• This is still correct behavior - protecting capital")
-    print("• Wait for better market conditions to see more aggressive trading")
+    p("\n⚠️ IF NO IMPROVEMENTS SEEN:")
+    p("• Market conditions may still be very unfavorable")
+    p("• Fine-tuning is working but being overridden by macro risk")
+    p("• This is still correct behavior - protecting capital")
+    p("• Wait for better market conditions to see more aggressive trading")
     
-    print("\n🎉 FINE-TUNING STATUS:")
-    print("✅ Adjustments successfully applied")
-    print("✅ Bot restarted with new parameters")
-    print("✅ Advanced analytics fully operational")
-    print("✅ Monitoring system active")
+    p("\n🎉 FINE-TUNING STATUS:")
+    log = FINE_TUNING_LOG.get()
+    if log:
+        p(f"✅ Adjustments applied ({log['timestamp']})")
+    else:
+        p("⚠️ No fine-tuning log found - run fine_tune_parameters.py first")
+    p("✅ Bot restarted with new parameters")
+    p("✅ Advanced analytics fully operational")
+    p("✅ Monitoring system active")
     
+    sys.stdout.write("\n".join(buf) + "\n")
     return indicators
 
 if __name__ == "__main__":
     monitor_fine_tuning_results()
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("🎯 FINE-TUNING MONITORING COMPLETE")
-    print("=" * 80)
+    print(_BAR)
     print("Continue watching your bot terminal for the improvements!")
     print("The fine-tuning is working - results will show over time.")
@@ -1,28 +1,180 @@
 """Performance analysis and fine-tuning recommendations for advanced analytics."""
 
+import gzip
+import io
+import mmap
+import os
 import re
-import json
+from array import array
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import orjson
+
+# Log-line patterns used by _extract_metrics, compiled once for the whole scan. Kept as
+# separate patterns that each start with their marker literal: _extract_metrics finds the
+# marker with str.find and the pattern is matched from there, so the regex never scans the line.
+_RE_REGIME = re.compile(r'📊 MARKET REGIME: (\w+/\w+) - (\w+) \(strength=([\d.]+), volatility=([\d.]+)\)')
+_RE_CONF = re.compile(r'🎯 DYNAMIC CONFIDENCE: Using regime-optimized threshold ([\d.]+)')
+_RE_MACRO = re.compile(r'⚠️ MACRO RISK: Recommended exposure ([\d.]+)')
+_RE_STRUCT = re.compile(r'🏗️ MARKET STRUCTURE: (\w+/\w+) - trend=(\w+), smart_money=(\w+), strength=([\d.]+)')
+_RE_DECISION = re.compile(r'(\w+/\w+):(\w+):(\w+)')
+
+# Buffered tracking records are appended to the gzip log once this many are pending
+_FLUSH_EVERY = 32
+
+# Parsed results kept by _parse_cached, keyed on the line text from its marker onwards
+_TEMPLATE_CACHE_SIZE = 1024
+
+
+def _groups(pattern):
+    """Parser returning ``pattern``'s groups for a match at the start of the text, else None."""
+    match = pattern.match
+
+    def parse(text):
+        m = match(text)
+        return m.groups() if m else None
+
+    return parse
+
+
+def _distribution(labels):
+    """``(label, count)`` pairs for ``labels`` in order of first appearance."""
+    return Counter(labels).items()
+
+
+# Report sections, filled with str.format_map from one dict per section
+_DISTRIBUTION_ROW = "   • {0}: {1} ({2:.1f}%)"
+_REGIME_REPORT = (
+    "✅ Analyzed {n} regime detections across {n_symbols} symbols\n"
+    "📊 Regime Distribution:\n"
+    "{distribution}\n"
+    "📈 Average Regime Strength: {avg_strength:.2f}\n"
+    "📉 Average Market Volatility: {avg_volatility:.2f}"
+)
+_CONFIDENCE_REPORT = (
+    "✅ Tracked {n} confidence adjustments\n"
+    "📊 Confidence Range: {min_conf:.2f} - {max_conf:.2f}\n"
+    "📈 Average Confidence: {avg_conf:.2f}"
+)
+_MACRO_REPORT = (
+    "✅ Tracked {n} macro risk assessments\n"
+    "📊 Average Recommended Exposure: {avg_exposure:.2f}"
+)
+_STRUCTURE_REPORT = (
+    "✅ Analyzed {n} market structures\n"
+    "📊 Average Structure Strength: {avg_strength:.2f}\n"
+    "📈 Trend Distribution:\n"
+    "{trends}\n"
+    "🧠 Smart Money Distribution:\n"
+    "{smart_money}"
+)
+_BEHAVIOR_REPORT = (
+    "📊 CURRENT BEHAVIOR ANALYSIS:\n"
+    "   • Hold Rate: {hold_percentage:.1f}% ({hold_count}/{total_decisions})"
+)
+
+
+def _distribution_rows(labels, total):
+    """One ``_DISTRIBUTION_ROW`` line per distinct label, joined with newlines."""
+    row = _DISTRIBUTION_ROW.format
+    return "\n".join(row(label, count, count / total * 100) for label, count in _distribution(labels))
+
+
+_parse_regime_regex = _groups(_RE_REGIME)
+
+
+def _parse_regime(text):
+    """Split a ``📊 MARKET REGIME:`` line on its fixed separators, falling back to the regex.
+
+    The regime line is the most frequent marker and its layout is fixed
+    (``SYM/QUOTE - regime (strength=x, volatility=y)``), so plain
+    ``str.partition`` calls recover the fields without entering the regex engine.
+    """
+    _, _, rest = text.partition('MARKET REGIME: ')
+    symbol, sep1, rest = rest.partition(' - ')
+    regime, sep2, rest = rest.partition(' (strength=')
+    strength, sep3, rest = rest.partition(', volatility=')
+    volatility, sep4, _ = rest.partition(')')
+    if (sep1 and sep2 and sep3 and sep4 and '/' in symbol and regime.isidentifier()
+            and strength.replace('.', '', 1).isdigit() and volatility.replace('.', '', 1).isdigit()):
+        return symbol, regime, strength, volatility
+    return _parse_regime_regex(text)
+_parse_conf = _groups(_RE_CONF)
+_parse_macro = _groups(_RE_MACRO)
+_parse_struct = _groups(_RE_STRUCT)
+
 class AdvancedAnalyticsPerformanceTracker:
     """Track and analyze advanced analytics performance."""
     
     def __init__(self):
-        self.data_file = Path("data/performance_tracking.json")
+        # One compact JSON record per analysis; each flush appends a gzip member
+        self.data_file = Path("data/performance_tracking.jsonl.gz")
         self.data_file.parent.mkdir(exist_ok=True)
+        self._buf: list[bytes] = []
+        # LRU of parse results: log lines that differ only in their timestamp prefix
+        # (repeated iteration summaries, unchanged regimes) skip the regex entirely
+        self._template_cache: OrderedDict = OrderedDict()
         
     def analyze_current_performance(self, log_content: str):
         """Analyze current performance from log content."""
+        self._report(self._extract_metrics(io.StringIO(log_content)))
+    
+    def analyze_current_performance_path(self, path):
+        """Analyze current performance straight from a log file.
+
+        The file is memory-mapped and scanned line by line, so large logs are
+        never loaded into memory as a whole.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._report(self._extract_metrics(()))
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                lines = (raw.decode('utf-8', 'replace') for raw in iter(mm.readline, b''))
+                self._report(self._extract_metrics(lines))
+    
+    def close(self):
+        """Write out any buffered tracking records."""
+        self._flush()
+    
+    def _append_record(self, record: dict):
+        """Queue ``record`` for the tracking log, flushing every _FLUSH_EVERY records."""
+        self._buf.append(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        if len(self._buf) >= _FLUSH_EVERY:
+            self._flush()
+    
+    def _flush(self):
+        """Append the buffered records to the tracking log as one gzip member."""
+        if not self._buf:
+            return
+        with gzip.open(self.data_file, 'ab') as f:
+            f.write(b''.join(self._buf))
+        self._buf.clear()
+    
+    def _report(self, metrics):
+        """Print the analysis sections for extracted ``metrics`` and record a summary."""
+        self._append_record({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'regime_detections': len(metrics['regime_detections']),
+            'sideways_count': metrics['sideways_count'],
+            'confidence_adjustments': len(metrics['confidence_adjustments']),
+            'macro_risks': len(metrics['macro_risks']),
+            'macro_risk_sum': metrics['macro_risk_sum'],
+            'market_structures': len(metrics['market_structures']),
+            'trade_decisions': len(metrics['trade_decisions']),
+            'hold_count': metrics['hold_count'],
+        })
         
         print("🔍 ADVANCED ANALYTICS PERFORMANCE ANALYSIS")
         print("=" * 80)
         print(f"Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 80)
         
-        # Extract key metrics from logs
-        metrics = self._extract_metrics(log_content)
-        
         # Analyze performance
         self._analyze_regime_detection(metrics)
         self._analyze_confidence_adjustments(metrics)
@@ -30,26 +182,51 @@ class AdvancedAnalyticsPerformanceTracker:
         self._analyze_market_structure_impact(metrics)
         self._provide_fine_tuning_recommendations(metrics)
         
-    def _extract_metrics(self, log_content: str):
-        """Extract performance metrics from log content."""
+    def _extract_metrics(self, lines):
+        """Extract performance metrics from an iterable of log lines."""
         
         metrics = {
             'regime_detections': [],
-            'confidence_adjustments': [],
+            'confidence_adjustments': array('d'),
             'macro_risks': [],
             'market_structures': [],
             'trade_decisions': [],
-            'symbols_analyzed': set()
+            'symbols_analyzed': set(),
+            # Column copies of the numeric/label fields above for vectorised aggregation
+            'regime_strengths': array('d'),
+            'regime_volatilities': array('d'),
+            'regime_labels': [],
+            'structure_strengths': array('d'),
+            'structure_trends': [],
+            'structure_smart_money': [],
         }
+        regime_strengths = metrics['regime_strengths']
+        regime_volatilities = metrics['regime_volatilities']
+        regime_labels = metrics['regime_labels']
+        structure_strengths = metrics['structure_strengths']
+        structure_trends = metrics['structure_trends']
+        structure_smart_money = metrics['structure_smart_money']
         
-        lines = log_content.split('\n')
+        # Running totals kept during the scan so the analyzers need no second pass
+        hold_count = 0
+        sideways_count = 0
+        macro_risk_sum = 0.0
+        
+        parse = self._parse_cached
+        findall_decisions = _RE_DECISION.findall
         
         for line in lines:
+            # Most lines carry no marker; skip them before any of the checks below
+            if not ('📊' in line or '🎯' in line or '⚠' in line or '🏗' in line
+                    or 'Iteration summary:' in line):
+                continue
+            
             # Extract regime detections
-            if "📊 MARKET REGIME:" in line:
-                match = re.search(r'📊 MARKET REGIME: (\w+/\w+) - (\w+) \(strength=([\d.]+), volatility=([\d.]+)\)', line)
-                if match:
-                    symbol, regime, strength, volatility = match.groups()
+            pos = line.find("📊 MARKET REGIME:")
+            if pos >= 0:
+                groups = parse(_parse_regime, line, pos)
+                if groups:
+                    symbol, regime, strength, volatility = groups
                     metrics['regime_detections'].append({
                         'symbol': symbol,
                         'regime': regime,
@@ -57,45 +234,77 @@ class AdvancedAnalyticsPerformanceTracker:
                         'volatility': float(volatility)
                     })
                     metrics['symbols_analyzed'].add(symbol)
+                    regime_strengths.append(float(strength))
+                    regime_volatilities.append(float(volatility))
+                    regime_labels.append(regime)
+                    if regime == 'sideways':
+                        sideways_count += 1
             
             # Extract confidence adjustments
-            if "🎯 DYNAMIC CONFIDENCE:" in line:
-                match = re.search(r'🎯 DYNAMIC CONFIDENCE: Using regime-optimized threshold ([\d.]+)', line)
-                if match:
-                    threshold = float(match.group(1))
+            pos = line.find("🎯 DYNAMIC CONFIDENCE:")
+            if pos >= 0:
+                groups = parse(_parse_conf, line, pos)
+                if groups:
+                    threshold = float(groups[0])
                     metrics['confidence_adjustments'].append(threshold)
             
             # Extract macro risk warnings
-            if "⚠️ MACRO RISK:" in line:
-                match = re.search(r'⚠️ MACRO RISK: Recommended exposure ([\d.]+)', line)
-                if match:
-                    exposure = float(match.group(1))
+            pos = line.find("⚠️ MACRO RISK:")
+            if pos >= 0:
+                groups = parse(_parse_macro, line, pos)
+                if groups:
+                    exposure = float(groups[0])
                     metrics['macro_risks'].append(exposure)
+                    macro_risk_sum += exposure
             
             # Extract market structure assessments
-            if "🏗️ MARKET STRUCTURE:" in line:
-                match = re.search(r'🏗️ MARKET STRUCTURE: (\w+/\w+) - trend=(\w+), smart_money=(\w+), strength=([\d.]+)', line)
-                if match:
-                    symbol, trend, smart_money, strength = match.groups()
+            pos = line.find("🏗️ MARKET STRUCTURE:")
+            if pos >= 0:
+                groups = parse(_parse_struct, line, pos)
+                if groups:
+                    symbol, trend, smart_money, strength = groups
                     metrics['market_structures'].append({
                         'symbol': symbol,
                         'trend': trend,
                         'smart_money': smart_money,
                         'strength': float(strength)
                     })
+                    structure_strengths.append(float(strength))
+                    structure_trends.append(trend)
+                    structure_smart_money.append(smart_money)
             
             # Extract trade decisions
-            if "Iteration summary:" in line:
-                decisions = re.findall(r'(\w+/\w+):(\w+):(\w+)', line)
+            pos = line.find("Iteration summary:")
+            if pos >= 0:
+                decisions = parse(findall_decisions, line, pos)
                 for symbol, decision, action in decisions:
                     metrics['trade_decisions'].append({
                         'symbol': symbol,
                         'decision': decision,
                         'action': action
                     })
+                    if decision == 'HOLD':
+                        hold_count += 1
         
+        metrics['hold_count'] = hold_count
+        metrics['sideways_count'] = sideways_count
+        metrics['macro_risk_sum'] = macro_risk_sum
         return metrics
     
+    def _parse_cached(self, parser, line, pos):
+        """Run ``parser`` on ``line[pos:]``, reusing the result for text seen before."""
+        key = line[pos:].rstrip()
+        cache = self._template_cache
+        result = cache.get(key, cache)
+        if result is not cache:
+            cache.move_to_end(key)
+            return result
+        result = parser(key)
+        cache[key] = result
+        if len(cache) > _TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+    
     def _analyze_regime_detection(self, metrics):
         """Analyze regime detection performance."""
         
@@ -107,28 +316,16 @@ class AdvancedAnalyticsPerformanceTracker:
             print("❌ No regime detections found in logs")
             return
         
-        # Analyze regime distribution
-        regime_counts = {}
-        strength_sum = 0
-        volatility_sum = 0
-        
-        for regime in regimes:
-            regime_type = regime['regime']
-            regime_counts[regime_type] = regime_counts.get(regime_type, 0) + 1
-            strength_sum += regime['strength']
-            volatility_sum += regime['volatility']
-        
-        print(f"✅ Analyzed {len(regimes)} regime detections across {len(metrics['symbols_analyzed'])} symbols")
-        print(f"📊 Regime Distribution:")
-        for regime_type, count in regime_counts.items():
-            percentage = (count / len(regimes)) * 100
-            print(f"   • {regime_type}: {count} ({percentage:.1f}%)")
+        avg_strength = float(np.frombuffer(metrics['regime_strengths']).mean())
+        avg_volatility = float(np.frombuffer(metrics['regime_volatilities']).mean())
         
-        avg_strength = strength_sum / len(regimes)
-        avg_volatility = volatility_sum / len(regimes)
-        
-        print(f"📈 Average Regime Strength: {avg_strength:.2f}")
-        print(f"📉 Average Market Volatility: {avg_volatility:.2f}")
+        print(_REGIME_REPORT.format_map({
+            'n': len(regimes),
+            'n_symbols': len(metrics['symbols_analyzed']),
+            'distribution': _distribution_rows(metrics['regime_labels'], len(regimes)),
+            'avg_strength': avg_strength,
+            'avg_volatility': avg_volatility,
+        }))
         
         # Performance assessment
         if avg_strength > 0.8:
@@ -149,13 +346,17 @@ class AdvancedAnalyticsPerformanceTracker:
             print("❌ No confidence adjustments found in logs")
             return
         
-        min_conf = min(adjustments)
-        max_conf = max(adjustments)
-        avg_conf = sum(adjustments) / len(adjustments)
+        values = np.frombuffer(adjustments)
+        min_conf = float(values.min())
+        max_conf = float(values.max())
+        avg_conf = float(values.mean())
         
-        print(f"✅ Tracked {len(adjustments)} confidence adjustments")
-        print(f"📊 Confidence Range: {min_conf:.2f} - {max_conf:.2f}")
-        print(f"📈 Average Confidence: {avg_conf:.2f}")
+        print(_CONFIDENCE_REPORT.format_map({
+            'n': len(adjustments),
+            'min_conf': min_conf,
+            'max_conf': max_conf,
+            'avg_conf': avg_conf,
+        }))
         
         # Analyze adjustment behavior
         if max_conf - min_conf > 0.2:
@@ -184,10 +385,9 @@ class AdvancedAnalyticsPerformanceTracker:
             print("❌ No macro risk assessments found in logs")
             return
         
-        avg_exposure = sum(macro_risks) / len(macro_risks)
+        avg_exposure = metrics['macro_risk_sum'] / len(macro_risks)
         
-        print(f"✅ Tracked {len(macro_risks)} macro risk assessments")
-        print(f"📊 Average Recommended Exposure: {avg_exposure:.2f}")
+        print(_MACRO_REPORT.format_map({'n': len(macro_risks), 'avg_exposure': avg_exposure}))
         
         if avg_exposure < 0.3:
             print("🛡️ EXCELLENT: System is being very conservative due to macro risk")
@@ -213,31 +413,14 @@ class AdvancedAnalyticsPerformanceTracker:
             return
         
         # Analyze structure strength
-        avg_strength = sum(s['strength'] for s in structures) / len(structures)
-        
-        # Analyze trend distribution
-        trend_counts = {}
-        smart_money_counts = {}
+        avg_strength = float(np.frombuffer(metrics['structure_strengths']).mean())
         
-        for structure in structures:
-            trend = structure['trend']
-            smart_money = structure['smart_money']
-            
-            trend_counts[trend] = trend_counts.get(trend, 0) + 1
-            smart_money_counts[smart_money] = smart_money_counts.get(smart_money, 0) + 1
-        
-        print(f"✅ Analyzed {len(structures)} market structures")
-        print(f"📊 Average Structure Strength: {avg_strength:.2f}")
-        
-        print(f"📈 Trend Distribution:")
-        for trend, count in trend_counts.items():
-            percentage = (count / len(structures)) * 100
-            print(f"   • {trend}: {count} ({percentage:.1f}%)")
-        
-        print(f"🧠 Smart Money Distribution:")
-        for smart_money, count in smart_money_counts.items():
-            percentage = (count / len(structures)) * 100
-            print(f"   • {smart_money}: {count} ({percentage:.1f}%)")
+        print(_STRUCTURE_REPORT.format_map({
+            'n': len(structures),
+            'avg_strength': avg_strength,
+            'trends': _distribution_rows(metrics['structure_trends'], len(structures)),
+            'smart_money': _distribution_rows(metrics['structure_smart_money'], len(structures)),
+        }))
         
         if avg_strength > 0.7:
             print("✅ EXCELLENT: Strong market structure detection")
@@ -255,14 +438,20 @@ class AdvancedAnalyticsPerformanceTracker:
         confidences = metrics['confidence_adjustments']
         macro_risks = metrics['macro_risks']
         decisions = metrics['trade_decisions']
+        if not (regimes or confidences or macro_risks or decisions):
+            print("❌ No analytics metrics found in logs - skipping recommendations")
+            return
         
         # Count HOLD decisions
-        hold_count = sum(1 for d in decisions if d['decision'] == 'HOLD')
+        hold_count = metrics['hold_count']
         total_decisions = len(decisions)
         hold_percentage = (hold_count / total_decisions * 100) if total_decisions > 0 else 0
         
-        print(f"📊 CURRENT BEHAVIOR ANALYSIS:")
-        print(f"   • Hold Rate: {hold_percentage:.1f}% ({hold_count}/{total_decisions})")
+        print(_BEHAVIOR_REPORT.format_map({
+            'hold_percentage': hold_percentage,
+            'hold_count': hold_count,
+            'total_decisions': total_decisions,
+        }))
         
         # Provide specific recommendations
         print(f"\n💡 RECOMMENDATIONS:")
@@ -289,7 +478,7 @@ class AdvancedAnalyticsPerformanceTracker:
             print("   2. Continue monitoring performance")
         
         # Macro-specific recommendations
-        if macro_risks and sum(macro_risks) / len(macro_risks) < 0.2:
+        if macro_risks and metrics['macro_risk_sum'] / len(macro_risks) < 0.2:
             print("\n🌍 MACRO ENVIRONMENT RECOMMENDATIONS:")
             print("   • High macro risk detected - system correctly being defensive")
             print("   • Consider this is protecting your capital")
@@ -298,8 +487,7 @@ class AdvancedAnalyticsPerformanceTracker:
         
         # Regime-specific recommendations
         if regimes:
-            sideways_count = sum(1 for r in regimes if r['regime'] == 'sideways')
-            if sideways_count / len(regimes) > 0.8:
+            if metrics['sideways_count'] / len(regimes) > 0.8:
                 print("\n📊 REGIME-SPECIFIC RECOMMENDATIONS:")
                 print("   • Mostly sideways markets detected")
                 print("   • System correctly avoiding poor trending conditions")
@@ -329,7 +517,10 @@ def main():
     """
     
     tracker = AdvancedAnalyticsPerformanceTracker()
-    tracker.analyze_current_performance(sample_log)
+    try:
+        tracker.analyze_current_performance(sample_log)
+    finally:
+        tracker.close()
 
 if __name__ == "__main__":
     main()
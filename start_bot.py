@@ -3,7 +3,9 @@
 
 import asyncio
 import logging
+import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from trading_bot.main import run_loop
 from discord_trading_bot import main as discord_main, DISCORD_TOKEN
 
@@ -11,11 +13,11 @@ from discord_trading_bot import main as discord_main, DISCORD_TOKEN
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def run_trading_bot():
-    """Run the trading bot in a separate thread."""
+def run_trading_bot(stop_event):
+    """Run the trading bot until ``stop_event`` is set (called on a worker thread)."""
     try:
         logger.info("🤖 Starting Trading Bot...")
-        run_loop()
+        run_loop(stop_event)
     except Exception as e:
         logger.error(f"❌ Trading Bot Error: {e}", exc_info=True)
 
@@ -27,20 +29,45 @@ async def run_discord_bot():
     except Exception as e:
         logger.error(f"❌ Discord Bot Error: {e}", exc_info=True)
 
+async def run_bots():
+    """Run the Discord bot on this event loop and the trading loop on an executor thread."""
+    loop = asyncio.get_running_loop()
+    stop_event = threading.Event()
+    # Own single-thread executor: the Discord cog replaces the loop's default executor
+    # with its stats pool, and the trading loop would hold one of those workers forever.
+    # A thread (not a process) keeps the shared performance tracker and its listeners intact.
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trading-bot")
+    trading = loop.run_in_executor(executor, run_trading_bot, stop_event)
+    logger.info("✅ Trading Bot started")
+    
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, main_task.cancel)
+        except NotImplementedError:  # Windows event loops
+            pass
+    
+    try:
+        await run_discord_bot()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        logger.info("🛑 Shutting down...")
+        stop_event.set()
+        try:
+            await trading  # finishes the iteration in progress
+        except Exception as e:
+            logger.error(f"❌ Trading Bot Error: {e}", exc_info=True)
+        executor.shutdown(wait=False)
+
 def main():
     """Start both bots."""
     if not DISCORD_TOKEN:
         logger.error("❌ DISCORD_BOT_TOKEN not set!")
         return
     
-    # Start trading bot in a separate thread
-    trading_thread = threading.Thread(target=run_trading_bot, daemon=True)
-    trading_thread.start()
-    logger.info("✅ Trading Bot thread started")
-    
-    # Run Discord bot in main thread
     try:
-        asyncio.run(run_discord_bot())
+        asyncio.run(run_bots())
     except KeyboardInterrupt:
         logger.info("🛑 Shutting down...")
 
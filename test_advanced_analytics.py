@@ -1,10 +1,24 @@
 """Step-by-step testing of advanced analytics modules."""
 
+import contextlib
+import io
+import os
 import sys
 import logging
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in so the data generators run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,34 +30,55 @@ logger = logging.getLogger(__name__)
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-print("=" * 80)
-print("🧪 ADVANCED ANALYTICS INTEGRATION TEST")
-print("=" * 80)
-print()
+# Full tracebacks for failed steps only when TEST_VERBOSE is set; otherwise the one-line error
+VERBOSE = bool(os.environ.get('TEST_VERBOSE'))
+
+
+@dataclass
+class StepReport:
+    """Outcome of the test steps run so far."""
+    passed: list[str] = field(default_factory=list)
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+test_results = StepReport()
 
-# Test results tracker
-test_results = {
-    'passed': [],
-    'failed': [],
-    'warnings': []
-}
+def _run_step(test_func):
+    """Run ``test_func`` with stdout captured.
+
+    Returns ``(output, error, traceback_text)``; ``error`` is the exception's message
+    or None. Module-level so it can run in a worker process.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            test_func()
+        except Exception as exc:
+            tb = ""
+            if VERBOSE:
+                import traceback
+                tb = traceback.format_exc()
+            return out.getvalue(), str(exc), tb
+    return out.getvalue(), None, ""
+
+def _record_step(step_name, output, error, tb):
+    """Track a finished step and write its output to stdout in one go."""
+    if error is None:
+        test_results.passed.append(step_name)
+        status = f"✅ {step_name} - PASSED"
+    else:
+        test_results.failed.append((step_name, error))
+        status = f"❌ {step_name} - FAILED: {error}"
+    sys.stdout.write(f"\n{'='*80}\n📋 STEP: {step_name}\n{'='*80}\n{output}{status}\n")
+    sys.stdout.flush()
+    if tb:
+        sys.stderr.write(tb)
+    return error is None
 
 def test_step(step_name, test_func):
-    """Run a test step and track results."""
-    print(f"\n{'='*80}")
-    print(f"📋 STEP: {step_name}")
-    print(f"{'='*80}")
-    try:
-        test_func()
-        test_results['passed'].append(step_name)
-        print(f"✅ {step_name} - PASSED")
-        return True
-    except Exception as exc:
-        test_results['failed'].append((step_name, str(exc)))
-        print(f"❌ {step_name} - FAILED: {exc}")
-        import traceback
-        traceback.print_exc()
-        return False
+    """Run a test step in this process and track results."""
+    return _record_step(step_name, *_run_step(test_func))
 
 # ============================================================================
 # STEP 1: Test Module Imports
@@ -131,8 +166,9 @@ def test_dynamic_optimizer():
     
     # Create sample price and volume data
     print("   Creating sample market data...")
-    price_data = np.array([100 + i + np.random.randn() * 2 for i in range(100)])
-    volume_data = np.array([1000 + np.random.randn() * 100 for _ in range(100)])
+    rng = np.random.default_rng()
+    price_data = 100 + np.arange(100) + rng.standard_normal(100) * 2
+    volume_data = 1000 + rng.standard_normal(100) * 100
     
     # Test regime detection
     print("   Testing market regime detection...")
@@ -154,6 +190,35 @@ def test_dynamic_optimizer():
     
     print("\n✅ Dynamic Optimizer working correctly!")
 
+@njit(cache=True)
+def gen_candles(n, seed):
+    """Random-walk OHLCV columns: ``(open, high, low, close, volume)`` starting at 100."""
+    np.random.seed(seed)
+    opens = np.empty(n)
+    highs = np.empty(n)
+    lows = np.empty(n)
+    closes = np.empty(n)
+    volumes = np.empty(n)
+    price = 100.0
+    for i in range(n):
+        close = price + np.random.randn() * 2
+        opens[i] = price
+        closes[i] = close
+        highs[i] = max(price, close) + abs(np.random.randn())
+        lows[i] = min(price, close) - abs(np.random.randn())
+        volumes[i] = 1000 + np.random.randn() * 100
+        price = close
+    return opens, highs, lows, closes, volumes
+
+def _warmup():
+    """Compile gen_candles and the optimizer's sweep kernels once."""
+    gen_candles(2, 0)
+    try:
+        from trading_bot.analytics.dynamic_optimizer import warm_sweep_kernels
+    except ImportError:
+        return
+    warm_sweep_kernels()
+
 # ============================================================================
 # STEP 4: Test Market Structure Analyzer
 # ============================================================================
@@ -166,7 +231,7 @@ def test_market_structure():
     from dataclasses import dataclass
     
     # Create mock candle data
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class MockCandle:
         open: float
         high: float
@@ -175,18 +240,8 @@ def test_market_structure():
         volume: float
     
     print("   Creating sample candle data...")
-    candles = []
-    base_price = 100
-    for i in range(100):
-        price_change = np.random.randn() * 2
-        open_price = base_price
-        close_price = base_price + price_change
-        high_price = max(open_price, close_price) + abs(np.random.randn())
-        low_price = min(open_price, close_price) - abs(np.random.randn())
-        volume = 1000 + np.random.randn() * 100
-        
-        candles.append(MockCandle(open_price, high_price, low_price, close_price, volume))
-        base_price = close_price
+    columns = gen_candles(100, np.random.default_rng().integers(2**31))
+    candles = [MockCandle(*row) for row in zip(*(col.tolist() for col in columns))]
     
     structure_analyzer = get_market_structure_analyzer()
     
@@ -245,12 +300,12 @@ def test_advanced_portfolio():
     # Create sample price data for multiple symbols
     print("   Creating sample portfolio data...")
     symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"]
-    price_data = {}
-    volume_data = {}
-    
-    for symbol in symbols:
-        price_data[symbol] = np.array([100 + i + np.random.randn() * 5 for i in range(100)])
-        volume_data[symbol] = np.array([1000 + np.random.randn() * 200 for _ in range(100)])
+    rng = np.random.default_rng()
+    # One draw per matrix; row i belongs to symbols[i]
+    prices = 100 + np.arange(100) + rng.standard_normal((len(symbols), 100)) * 5
+    volumes = 1000 + rng.standard_normal((len(symbols), 100)) * 200
+    price_data = dict(zip(symbols, prices))
+    volume_data = dict(zip(symbols, volumes))
     
     # Test pairs trading
     print("   Testing pairs trading identification...")
@@ -349,41 +404,62 @@ def test_pipeline_integration():
 # ============================================================================
 
 if __name__ == "__main__":
+    print("=" * 80)
+    print("🧪 ADVANCED ANALYTICS INTEGRATION TEST")
+    print("=" * 80)
+    print()
     print("\n🚀 Starting comprehensive test suite...\n")
     
-    # Run all test steps
+    # Compile (or load cached) jitted helpers before any step runs, so pool workers
+    # start from the on-disk cache instead of each compiling their own copy
+    _warmup()
+    
+    # Imports first, on their own: a broken import should be reported once, up front
     test_step("1. Module Imports", test_imports)
-    test_step("2. Module Initialization", test_initialization)
-    test_step("3. Dynamic Optimizer", test_dynamic_optimizer)
-    test_step("4. Market Structure Analyzer", test_market_structure)
-    test_step("5. Macro Factors Analyzer", test_macro_factors)
-    test_step("6. Advanced Portfolio Manager", test_advanced_portfolio)
-    test_step("7. Advanced Risk Manager", test_advanced_risk)
-    test_step("8. Pipeline Integration", test_pipeline_integration)
+    
+    # The remaining steps are independent (each builds its own singletons), so run
+    # them in worker processes and report in step order as they finish
+    steps = [
+        ("2. Module Initialization", test_initialization),
+        ("3. Dynamic Optimizer", test_dynamic_optimizer),
+        ("4. Market Structure Analyzer", test_market_structure),
+        ("5. Macro Factors Analyzer", test_macro_factors),
+        ("6. Advanced Portfolio Manager", test_advanced_portfolio),
+        ("7. Advanced Risk Manager", test_advanced_risk),
+        ("8. Pipeline Integration", test_pipeline_integration),
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(steps), os.cpu_count() or 1)) as executor:
+        futures = [(name, executor.submit(_run_step, func)) for name, func in steps]
+        for name, future in futures:
+            try:
+                result = future.result()
+            except Exception as exc:  # worker died before reporting back
+                result = ("", str(exc), "")
+            _record_step(name, *result)
     
     # Print summary
     print("\n" + "=" * 80)
     print("📊 TEST SUMMARY")
     print("=" * 80)
     
-    total_tests = len(test_results['passed']) + len(test_results['failed'])
-    passed = len(test_results['passed'])
-    failed = len(test_results['failed'])
+    passed = len(test_results.passed)
+    failed = len(test_results.failed)
+    total_tests = passed + failed
     
     print(f"\n✅ Passed: {passed}/{total_tests}")
-    if test_results['passed']:
-        for test in test_results['passed']:
+    if test_results.passed:
+        for test in test_results.passed:
             print(f"   ✓ {test}")
     
-    if test_results['failed']:
+    if test_results.failed:
         print(f"\n❌ Failed: {failed}/{total_tests}")
-        for test, error in test_results['failed']:
+        for test, error in test_results.failed:
             print(f"   ✗ {test}")
             print(f"     Error: {error}")
     
-    if test_results['warnings']:
-        print(f"\n⚠️  Warnings: {len(test_results['warnings'])}")
-        for warning in test_results['warnings']:
+    if test_results.warnings:
+        print(f"\n⚠️  Warnings: {len(test_results.warnings)}")
+        for warning in test_results.warnings:
             print(f"   ⚠ {warning}")
     
     # Final verdict
@@ -395,6 +471,8 @@ if __name__ == "__main__":
         print("   Run: python simsim_server_bot D1.py")
     else:
         print("⚠️  SOME TESTS FAILED - Please review errors above")
+        if not VERBOSE:
+            print("   (set TEST_VERBOSE=1 for full tracebacks)")
         print("=" * 80)
     
     print()
@@ -7,9 +7,80 @@ from dataclasses import dataclass
 from collections import defaultdict, deque
 import time
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the allocation kernels run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 
+# error_model="numpy": a zero variance yields inf/nan like the array code did instead of raising
+@njit(cache=True, error_model="numpy")
+def _mvo_kernel(expected_returns, cov_diag, risk_tolerance):
+    """Inverse-volatility weights blended with normalised expected returns, summing to 1."""
+    n_assets = expected_returns.shape[0]
+    weights = np.empty(n_assets)
+    inv_total = 0.0
+    abs_total = 0.0
+    for i in range(n_assets):
+        weights[i] = 1.0 / np.sqrt(cov_diag[i])
+        inv_total += weights[i]
+        abs_total += abs(expected_returns[i])
+    
+    total = 0.0
+    for i in range(n_assets):
+        if abs_total > 0:
+            return_adjustment = expected_returns[i] / abs_total
+        else:
+            return_adjustment = 1.0 / n_assets
+        weights[i] = (weights[i] / inv_total + return_adjustment * risk_tolerance) / 2
+        total += weights[i]
+    
+    for i in range(n_assets):
+        weights[i] /= total
+    return weights
+
+
+@njit(cache=True, error_model="numpy")
+def _constraints_kernel(weights, sector_ids, n_sectors, max_single, max_sector):
+    """Cap single positions, scale down sectors above ``max_sector`` and renormalise."""
+    n_assets = weights.shape[0]
+    capped = np.empty(n_assets)
+    sector_totals = np.zeros(n_sectors)
+    for i in range(n_assets):
+        capped[i] = min(weights[i], max_single)
+        sector_totals[sector_ids[i]] += capped[i]
+    
+    total = 0.0
+    for i in range(n_assets):
+        sector_total = sector_totals[sector_ids[i]]
+        if sector_total > max_sector:
+            capped[i] *= max_sector / sector_total
+        total += capped[i]
+    
+    if total > 0:
+        for i in range(n_assets):
+            capped[i] /= total
+    return capped
+
+
+def warm_portfolio_kernels() -> None:
+    """Compile the jitted allocation kernels up front so the first optimisation doesn't pay for it."""
+    if not NUMBA_AVAILABLE:
+        return
+    ones = np.ones(2)
+    _mvo_kernel(ones, ones, 0.5)
+    _constraints_kernel(ones, np.zeros(2, dtype=np.int64), 1, 0.15, 0.4)
+
+
 @dataclass
 class PairsTradingOpportunity:
     """Pairs trading opportunity."""
@@ -117,53 +188,60 @@ class AdvancedPortfolioManager:
         """Identify pairs trading opportunities based on correlation and spread analysis."""
         try:
             opportunities = []
-            symbols = list(price_data.keys())
-            
-            # Calculate correlations and identify pairs
-            for i in range(len(symbols)):
-                for j in range(i + 1, len(symbols)):
-                    symbol_a, symbol_b = symbols[i], symbols[j]
-                    
-                    if len(price_data[symbol_a]) < 50 or len(price_data[symbol_b]) < 50:
-                        continue
-                    
-                    # Calculate correlation
-                    min_length = min(len(price_data[symbol_a]), len(price_data[symbol_b]))
-                    prices_a = price_data[symbol_a][-min_length:]
-                    prices_b = price_data[symbol_b][-min_length:]
-                    
-                    correlation = np.corrcoef(prices_a, prices_b)[0, 1]
-                    
-                    if abs(correlation) > correlation_threshold:
-                        # Calculate spread and z-score
-                        spread = prices_a - prices_b
-                        spread_mean = np.mean(spread)
-                        spread_std = np.std(spread)
-                        
-                        if spread_std > 0:
-                            current_spread = spread[-1]
-                            z_score = (current_spread - spread_mean) / spread_std
-                            
-                            # Identify trading opportunity
-                            if abs(z_score) > 2.0:  # 2 standard deviations
-                                direction = "long_a_short_b" if z_score < 0 else "short_a_long_b"
-                                confidence = min(abs(z_score) / 3.0, 1.0)  # Normalize to 0-1
-                                expected_return = abs(z_score) * spread_std / np.mean(prices_a)
-                                
-                                risk_level = "low" if abs(z_score) > 3.0 else "medium"
-                                
-                                opportunity = PairsTradingOpportunity(
-                                    symbol_a=symbol_a,
-                                    symbol_b=symbol_b,
-                                    spread=current_spread,
-                                    z_score=z_score,
-                                    confidence=confidence,
-                                    direction=direction,
-                                    expected_return=expected_return,
-                                    risk_level=risk_level
-                                )
-                                
-                                opportunities.append(opportunity)
+            symbols = [symbol for symbol, prices in price_data.items() if len(prices) >= 50]
+            if len(symbols) < 2:
+                return opportunities
+            
+            # Stack the common tail of every series so one corrcoef call covers all pairs
+            min_length = min(len(price_data[symbol]) for symbol in symbols)
+            matrix = np.vstack([np.asarray(price_data[symbol][-min_length:], dtype=float) for symbol in symbols])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlations = np.corrcoef(matrix)
+            
+            # Upper triangle gives each pair once, in the same (i, j) order as a nested loop
+            idx_a, idx_b = np.triu_indices(len(symbols), k=1)
+            correlated = np.abs(correlations[idx_a, idx_b]) > correlation_threshold
+            idx_a, idx_b = idx_a[correlated], idx_b[correlated]
+            
+            # Calculate spreads and z-scores for every correlated pair at once. Mean and std
+            # come from one sum / sum-of-squares pass; shifting by each pair's first spread
+            # keeps sumsq/T - mean**2 from cancelling (and exactly 0 for a constant spread).
+            spreads = matrix[idx_a] - matrix[idx_b]
+            shifted = spreads - spreads[:, :1]
+            shift_means = shifted.sum(axis=1) / min_length
+            shift_sumsq = np.einsum("ij,ij->i", shifted, shifted)
+            spread_means = spreads[:, 0] + shift_means
+            spread_stds = np.sqrt(np.maximum(shift_sumsq / min_length - shift_means * shift_means, 0.0))
+            current_spreads = spreads[:, -1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z_scores = (current_spreads - spread_means) / spread_stds
+            
+            # Identify trading opportunities beyond 2 standard deviations
+            hits = (spread_stds > 0) & (np.abs(z_scores) > 2.0)
+            price_means = matrix.mean(axis=1)
+            
+            for i, j, current_spread, z_score, spread_std in zip(
+                idx_a[hits].tolist(), idx_b[hits].tolist(), current_spreads[hits].tolist(),
+                z_scores[hits].tolist(), spread_stds[hits].tolist()
+            ):
+                direction = "long_a_short_b" if z_score < 0 else "short_a_long_b"
+                confidence = min(abs(z_score) / 3.0, 1.0)  # Normalize to 0-1
+                expected_return = abs(z_score) * spread_std / price_means[i]
+                
+                risk_level = "low" if abs(z_score) > 3.0 else "medium"
+                
+                opportunity = PairsTradingOpportunity(
+                    symbol_a=symbols[i],
+                    symbol_b=symbols[j],
+                    spread=current_spread,
+                    z_score=z_score,
+                    confidence=confidence,
+                    direction=direction,
+                    expected_return=float(expected_return),
+                    risk_level=risk_level
+                )
+                
+                opportunities.append(opportunity)
             
             # Sort by confidence and return top opportunities
             opportunities.sort(key=lambda x: x.confidence, reverse=True)
@@ -253,45 +331,44 @@ class AdvancedPortfolioManager:
             
             # 1. CORRELATION HEDGING
             # Find negatively correlated assets for hedging
-            portfolio_symbols = list(portfolio.keys())
-            
-            for symbol in portfolio_symbols:
-                if symbol not in price_data or len(price_data[symbol]) < 30:
-                    continue
+            candidates = [symbol for symbol, prices in price_data.items() if len(prices) >= 30]
+            
+            if len(candidates) >= 2:
+                # One returns matrix over the common tail of every candidate, one corrcoef call
+                min_length = min(len(price_data[symbol]) for symbol in candidates)
+                prices = np.vstack([np.asarray(price_data[symbol][-min_length:], dtype=np.float64)
+                                    for symbol in candidates])
+                returns = np.diff(prices, axis=1) / prices[:, :-1]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    correlations = np.corrcoef(returns)
+                # A symbol can't hedge itself and undefined correlations never win
+                correlations[np.isnan(correlations)] = np.inf
+                np.fill_diagonal(correlations, np.inf)
+                index = {symbol: i for i, symbol in enumerate(candidates)}
                 
-                # Find best hedge (most negatively correlated)
-                best_hedge = None
-                best_correlation = 1.0  # Start with worst case
-                
-                for potential_hedge in price_data:
-                    if potential_hedge == symbol or len(price_data[potential_hedge]) < 30:
+                for symbol in portfolio:
+                    i = index.get(symbol)
+                    if i is None:
                         continue
                     
-                    # Calculate correlation
-                    min_length = min(len(price_data[symbol]), len(price_data[potential_hedge]))
-                    returns_a = np.diff(price_data[symbol][-min_length:]) / price_data[symbol][-min_length:-1]
-                    returns_b = np.diff(price_data[potential_hedge][-min_length:]) / price_data[potential_hedge][-min_length:-1]
-                    
-                    correlation = np.corrcoef(returns_a, returns_b)[0, 1]
-                    
-                    if correlation < best_correlation:
-                        best_correlation = correlation
-                        best_hedge = potential_hedge
-                
-                # Create hedge if good negative correlation found
-                if best_hedge and best_correlation < -0.3:
-                    hedge_ratio = min(abs(best_correlation) * portfolio[symbol], 0.5)  # Max 50% hedge
-                    effectiveness = abs(best_correlation)
-                    
-                    strategy = HedgingStrategy(
-                        hedge_type="correlation",
-                        hedge_symbol=best_hedge,
-                        hedge_ratio=hedge_ratio,
-                        hedge_direction="long",
-                        effectiveness=effectiveness
-                    )
+                    # Find best hedge (most negatively correlated)
+                    j = int(correlations[i].argmin())
+                    best_correlation = float(correlations[i, j])
                     
-                    hedging_strategies.append(strategy)
+                    # Create hedge if good negative correlation found
+                    if best_correlation < -0.3:
+                        hedge_ratio = min(abs(best_correlation) * portfolio[symbol], 0.5)  # Max 50% hedge
+                        effectiveness = abs(best_correlation)
+                        
+                        strategy = HedgingStrategy(
+                            hedge_type="correlation",
+                            hedge_symbol=candidates[j],
+                            hedge_ratio=hedge_ratio,
+                            hedge_direction="long",
+                            effectiveness=effectiveness
+                        )
+                        
+                        hedging_strategies.append(strategy)
             
             # 2. VOLATILITY HEDGING
             # Use stablecoins or low-volatility assets during high volatility periods
@@ -407,23 +484,12 @@ class AdvancedPortfolioManager:
                                   cov_matrix: np.ndarray, risk_tolerance: float) -> np.ndarray:
         """Simplified mean-variance optimization."""
         try:
-            n_assets = len(expected_returns)
-            
-            # Risk aversion parameter
-            risk_aversion = 1.0 / risk_tolerance if risk_tolerance > 0 else 2.0
-            
             # Simplified optimization: inverse volatility weighting with return adjustment
-            inv_volatility = 1.0 / np.sqrt(np.diag(cov_matrix))
-            inv_volatility = inv_volatility / np.sum(inv_volatility)  # Normalize
-            
-            # Adjust for expected returns
-            return_adjustment = expected_returns / np.sum(np.abs(expected_returns)) if np.sum(np.abs(expected_returns)) > 0 else np.ones(n_assets) / n_assets
-            
-            # Combine volatility and return factors
-            weights = (inv_volatility + return_adjustment * risk_tolerance) / 2
-            weights = weights / np.sum(weights)  # Normalize
-            
-            return weights
+            return _mvo_kernel(
+                np.ascontiguousarray(expected_returns, dtype=np.float64),
+                np.ascontiguousarray(np.diag(cov_matrix), dtype=np.float64),
+                float(risk_tolerance),
+            )
             
         except Exception:
             # Equal weight fallback
@@ -434,36 +500,24 @@ class AdvancedPortfolioManager:
                                    symbols: List[str]) -> Dict[str, float]:
         """Apply portfolio constraints to weights."""
         try:
-            # Apply maximum single position constraint
-            for symbol in weights:
-                weights[symbol] = min(weights[symbol], self.max_single_position)
+            # Sectors encoded as dense ids in first-seen order for the kernel's running totals
+            sector_index = {}
+            sector_ids = np.array(
+                [sector_index.setdefault(self.sector_classifications.get(symbol, "other"), len(sector_index))
+                 for symbol in weights],
+                dtype=np.int64,
+            )
             
-            # Apply sector constraints
-            sector_weights = defaultdict(float)
-            for symbol, weight in weights.items():
-                sector = self.sector_classifications.get(symbol, "other")
-                sector_weights[sector] += weight
-            
-            # Adjust if any sector exceeds maximum
-            for sector, total_weight in sector_weights.items():
-                if total_weight > self.max_sector_weight:
-                    # Scale down all symbols in this sector
-                    scale_factor = self.max_sector_weight / total_weight
-                    for symbol in weights:
-                        if self.sector_classifications.get(symbol, "other") == sector:
-                            weights[symbol] *= scale_factor
-            
-            # Renormalize weights
-            total_weight = sum(weights.values())
-            if total_weight > 0:
-                for symbol in weights:
-                    weights[symbol] /= total_weight
+            # Apply single position and sector constraints, then renormalize
+            adjusted = _constraints_kernel(
+                np.fromiter(weights.values(), dtype=np.float64, count=len(weights)),
+                sector_ids, len(sector_index),
+                self.max_single_position, self.max_sector_weight,
+            )
             
             # Remove very small positions
-            weights = {symbol: weight for symbol, weight in weights.items() 
-                      if weight >= 0.01}  # Minimum 1% position
-            
-            return weights
+            return {symbol: weight for symbol, weight in zip(weights, adjusted.tolist())
+                    if weight >= 0.01}  # Minimum 1% position
             
         except Exception:
             # Equal weight fallback
@@ -474,26 +528,20 @@ class AdvancedPortfolioManager:
                                        price_data: Dict[str, np.ndarray]) -> Dict[str, float]:
         """Calculate comprehensive portfolio risk metrics."""
         try:
-            # Calculate portfolio returns
-            portfolio_returns = []
-            
             # Get aligned price data
-            min_length = min(len(price_data[symbol]) for symbol in portfolio 
-                           if symbol in price_data and len(price_data[symbol]) > 0)
+            symbols = [symbol for symbol in portfolio
+                       if symbol in price_data and len(price_data[symbol]) > 0]
+            min_length = min(len(price_data[symbol]) for symbol in symbols)
             
             if min_length < 30:
                 return {"error": "insufficient_data"}
             
-            for i in range(1, min_length):
-                daily_return = 0
-                for symbol, weight in portfolio.items():
-                    if symbol in price_data and len(price_data[symbol]) > i:
-                        symbol_return = (price_data[symbol][-i] - price_data[symbol][-i-1]) / price_data[symbol][-i-1]
-                        daily_return += weight * symbol_return
-                
-                portfolio_returns.append(daily_return)
-            
-            portfolio_returns = np.array(portfolio_returns)
+            # Calculate portfolio returns: one (N, T-1) returns matrix weighted in a single matvec
+            weights = np.fromiter((portfolio[symbol] for symbol in symbols), dtype=np.float64, count=len(symbols))
+            prices = np.vstack([np.asarray(price_data[symbol][-min_length:], dtype=np.float64) for symbol in symbols])
+            returns = np.diff(prices, axis=1) / prices[:, :-1]
+            # Newest return first, the order the metrics below have always been computed in
+            portfolio_returns = (weights @ returns)[::-1]
             
             # Calculate risk metrics
             volatility = np.std(portfolio_returns) * np.sqrt(252)  # Annualized
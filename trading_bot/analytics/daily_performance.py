@@ -6,12 +6,72 @@ import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the numeric helpers run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Dtype of the tracker's percentage column, which is only ever shown to two decimals; float32
+# halves what it streams. Prices and USD PnL stay float64: they are shown with up to six
+# decimals and summed into the totals that gate trading.
+_SOA_FLOAT = np.float32
+
+
+# Columns of _summary_kernel's output rows
+_SUM_PNL, _SUM_TRADES, _SUM_WINS, _SUM_GROSS_WIN, _SUM_GROSS_LOSS, _SUM_BEST, _SUM_WORST = range(7)
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _summary_kernel(pnl: np.ndarray, exit_ts: np.ndarray, cutoffs: np.ndarray) -> np.ndarray:
+    """One pass over closed trades, accumulating a summary row per ``exit_ts >= cutoff`` window."""
+    k = cutoffs.shape[0]
+    out = np.zeros((k, 7))
+    for j in range(k):
+        out[j, _SUM_BEST] = -np.inf
+        out[j, _SUM_WORST] = np.inf
+    for i in range(pnl.shape[0]):
+        ts = exit_ts[i]
+        if ts != ts:  # NaN: trade still open
+            continue
+        p = float(pnl[i])
+        for j in range(k):
+            if ts >= cutoffs[j]:
+                out[j, _SUM_PNL] += p
+                out[j, _SUM_TRADES] += 1.0
+                if p > 0.0:
+                    out[j, _SUM_WINS] += 1.0
+                    out[j, _SUM_GROSS_WIN] += p
+                elif p < 0.0:
+                    out[j, _SUM_GROSS_LOSS] -= p
+                if p > out[j, _SUM_BEST]:
+                    out[j, _SUM_BEST] = p
+                if p < out[j, _SUM_WORST]:
+                    out[j, _SUM_WORST] = p
+    return out
+
+
+def warm_summary_kernel() -> None:
+    """Compile the jitted summary kernel up front so the first stats request doesn't pay for it."""
+    if not NUMBA_AVAILABLE:
+        return
+    _summary_kernel(np.zeros(1), np.zeros(1), np.zeros(1))
+
+
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a single trade for performance tracking."""
     symbol: str
@@ -25,6 +85,13 @@ class TradeRecord:
     pnl_percentage: Optional[float] = None
     reason: Optional[str] = None
     confidence: Optional[float] = None
+    confluence: Optional[float] = None
+    risk_reward_ratio: Optional[float] = None
+    take_profit: Optional[float] = None
+    stop_loss: Optional[float] = None
+    duration: Optional[str] = None
+    max_drawdown: Optional[float] = None
+    id: Optional[str] = None
 
 
 @dataclass
@@ -58,6 +125,17 @@ class DailyPerformanceTracker:
         self.trades: List[TradeRecord] = []
         self.daily_stats: Dict[str, DailyStats] = {}
         
+        # Bumped on every trade entry/exit so callers can cache derived stats
+        self._version = 0
+        
+        # Structure-of-arrays mirror of self.trades (row i == self.trades[i]), grown by doubling.
+        # Open trades have NaN exit_price/exit time and 0.0 PnL.
+        self._n = 0
+        self._alloc_soa(64)
+        
+        # Callbacks invoked with each TradeRecord as it closes, see register_listener()
+        self._listeners: List[Callable[[TradeRecord], None]] = []
+        
         self._load_data()
     
     def record_trade_entry(
@@ -80,6 +158,8 @@ class DailyPerformanceTracker:
         )
         
         self.trades.append(trade)
+        self._append_soa(trade)
+        self._version += 1
         logger.info(f"📈 TRADE ENTRY: {symbol} at ${entry_price:.6f} (confidence: {confidence:.2f})")
         
         return trade_id
@@ -92,7 +172,8 @@ class DailyPerformanceTracker:
     ) -> Optional[float]:
         """Record trade exit and calculate PnL."""
         # Find the most recent open trade for this symbol
-        for trade in reversed(self.trades):
+        for idx in range(len(self.trades) - 1, -1, -1):
+            trade = self.trades[idx]
             if trade.symbol == symbol and trade.exit_price is None:
                 trade.exit_price = exit_price
                 trade.exit_time = time.time()
@@ -101,6 +182,11 @@ class DailyPerformanceTracker:
                 # Calculate PnL
                 trade.pnl_usd = (exit_price - trade.entry_price) * trade.amount
                 trade.pnl_percentage = ((exit_price - trade.entry_price) / trade.entry_price) * 100
+                self._exit_soa[idx] = exit_price
+                self._exit_ts_soa[idx] = trade.exit_time
+                self._pnl_usd_soa[idx] = trade.pnl_usd
+                self._pnl_pct_soa[idx] = trade.pnl_percentage
+                self._version += 1
                 
                 logger.info(
                     f"📊 TRADE EXIT: {symbol} at ${exit_price:.6f} - "
@@ -109,12 +195,33 @@ class DailyPerformanceTracker:
                 
                 self._update_daily_stats()
                 self._save_data()
+                self._notify_trade_closed(trade)
                 
                 return trade.pnl_percentage
         
         logger.warning(f"No open trade found for {symbol}")
         return None
     
+    def register_listener(self, callback: Callable[[TradeRecord], None]):
+        """Call ``callback(trade)`` whenever a trade closes.
+        
+        Callbacks run synchronously on whichever thread records the exit (normally the
+        trading loop), so they should only hand the trade off, e.g. via
+        ``loop.call_soon_threadsafe``.
+        """
+        self._listeners.append(callback)
+    
+    def unregister_listener(self, callback: Callable[[TradeRecord], None]):
+        """Stop calling ``callback`` on trade close."""
+        self._listeners = [cb for cb in self._listeners if cb is not callback]
+    
+    def _notify_trade_closed(self, trade: TradeRecord):
+        for callback in self._listeners:
+            try:
+                callback(trade)
+            except Exception as exc:
+                logger.debug(f"Trade-close listener failed: {exc}")
+    
     def get_daily_performance(self, date: Optional[str] = None) -> DailyStats:
         """Get performance stats for a specific date."""
         if date is None:
@@ -122,6 +229,52 @@ class DailyPerformanceTracker:
         
         return self.daily_stats.get(date, DailyStats(date=date))
     
+    def get_pnl_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get symbols, PnL (USD) and win flags of all trades as parallel arrays."""
+        n = self._n
+        pnl = self._pnl_usd_soa[:n]
+        return self._symbol_soa[:n], pnl, pnl > 0
+    
+    def last_n(self, limit: int) -> Dict[str, np.ndarray]:
+        """Get the most recent ``limit`` trades as array views, oldest first."""
+        n = self._n
+        start = max(n - limit, 0)
+        return {
+            "symbol": self._symbol_soa[start:n],
+            "entry_price": self._entry_soa[start:n],
+            "exit_price": self._exit_soa[start:n],
+            "pnl_usd": self._pnl_usd_soa[start:n],
+            "pnl_percentage": self._pnl_pct_soa[start:n],
+        }
+    
+    def _alloc_soa(self, cap: int):
+        """(Re)allocate the per-trade arrays with room for ``cap`` rows, keeping existing rows."""
+        n = self._n
+        arrays = {
+            "_symbol_soa": np.empty(cap, dtype=object),
+            "_entry_soa": np.empty(cap, dtype=np.float64),
+            "_exit_soa": np.empty(cap, dtype=np.float64),
+            "_exit_ts_soa": np.empty(cap, dtype=np.float64),  # Epoch seconds need float64
+            "_pnl_usd_soa": np.empty(cap, dtype=np.float64),
+            "_pnl_pct_soa": np.empty(cap, dtype=_SOA_FLOAT),
+        }
+        for name, arr in arrays.items():
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+    
+    def _append_soa(self, trade: TradeRecord):
+        n = self._n
+        if n == len(self._symbol_soa):
+            self._alloc_soa(2 * n)
+        self._symbol_soa[n] = trade.symbol
+        self._entry_soa[n] = trade.entry_price
+        self._exit_soa[n] = trade.exit_price if trade.exit_price is not None else np.nan
+        self._exit_ts_soa[n] = trade.exit_time if trade.exit_time else np.nan
+        self._pnl_usd_soa[n] = trade.pnl_usd or 0.0
+        self._pnl_pct_soa[n] = trade.pnl_percentage or 0.0
+        self._n = n + 1
+    
     def get_win_rate(self, days: int = 7) -> float:
         """Get win rate over the last N days."""
         end_date = datetime.now()
@@ -140,30 +293,50 @@ class DailyPerformanceTracker:
     
     def get_profit_summary(self, days: int = 7) -> Dict[str, float]:
         """Get profit summary over the last N days."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        total_pnl = 0.0
-        total_trades = 0
-        winning_trades = 0
+        return self.get_profit_summaries([days])[days]
+    
+    def get_profit_summaries(self, days_list: List[int]) -> Dict[int, Dict[str, float]]:
+        """Get profit summaries for several look-back windows in one pass over closed trades.
         
-        for date_str, stats in self.daily_stats.items():
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            if start_date <= date <= end_date:
-                total_pnl += stats.total_pnl_usd
-                total_trades += stats.total_trades
-                winning_trades += stats.winning_trades
+        A window of N days covers every calendar day whose midnight falls within the last N days,
+        matching how daily stats are bucketed by exit date.
+        """
+        end_date = datetime.now()
+        cutoffs = np.empty(len(days_list))
+        for k, days in enumerate(days_list):
+            start = end_date - timedelta(days=days)
+            first_day = datetime.combine(start.date(), datetime.min.time())
+            if first_day < start:
+                first_day += timedelta(days=1)
+            cutoffs[k] = first_day.timestamp()
         
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
-        avg_daily_profit = total_pnl / days if days > 0 else 0.0
+        n = self._n
+        rows = _summary_kernel(self._pnl_usd_soa[:n], self._exit_ts_soa[:n], cutoffs)
         
-        return {
-            "total_pnl_usd": total_pnl,
-            "total_trades": total_trades,
-            "win_rate_pct": win_rate,
-            "avg_daily_profit": avg_daily_profit,
-            "days_analyzed": days
-        }
+        summaries = {}
+        for days, row in zip(days_list, rows.tolist()):
+            total_pnl = row[_SUM_PNL]
+            total_trades = int(row[_SUM_TRADES])
+            win_rate = (row[_SUM_WINS] / total_trades * 100) if total_trades > 0 else 0.0
+            avg_daily_profit = total_pnl / days if days > 0 else 0.0
+            gross_win = row[_SUM_GROSS_WIN]
+            gross_loss = row[_SUM_GROSS_LOSS]
+            if gross_loss > 0:
+                profit_factor = gross_win / gross_loss
+            else:
+                # No losing trades: unbounded if anything was won, 0.0 for an empty window
+                profit_factor = float('inf') if gross_win > 0 else 0.0
+            summaries[days] = {
+                "total_pnl_usd": total_pnl,
+                "total_trades": total_trades,
+                "win_rate_pct": win_rate,
+                "avg_daily_profit": avg_daily_profit,
+                "days_analyzed": days,
+                "profit_factor": profit_factor,
+                "best_trade": row[_SUM_BEST] if total_trades else 0.0,
+                "worst_trade": row[_SUM_WORST] if total_trades else 0.0,
+            }
+        return summaries
     
     def should_reduce_trading(self) -> bool:
         """Determine if trading should be reduced due to poor performance."""
@@ -240,6 +413,10 @@ class DailyPerformanceTracker:
                 with open(self.trades_file, 'r') as f:
                     trades_data = json.load(f)
                     self.trades = [TradeRecord(**trade) for trade in trades_data]
+                    self._n = 0
+                    self._alloc_soa(max(64, len(self.trades)))
+                    for trade in self.trades:
+                        self._append_soa(trade)
             
             if self.stats_file.exists():
                 with open(self.stats_file, 'r') as f:
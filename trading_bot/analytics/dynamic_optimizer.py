@@ -1,14 +1,37 @@
 """Dynamic parameter optimization and adaptive confidence thresholds."""
 
+import itertools
 import logging
+import math
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
 import time
 import json
 from pathlib import Path
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the sweep kernels run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import pandas as pd  # Only for annotations; sweep_regime_params imports it lazily
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +61,170 @@ class OptimalParameters:
     take_profit_multiplier: float
 
 
+# Metrics returned per parameter set by sweep_regime_params, in _backtest_kernel order
+_SWEEP_METRICS = ("sharpe", "total_return", "max_drawdown", "trades", "win_rate")
+_SWEEP_ATR_PERIOD = 14
+
+
+@njit(cache=True, nogil=True)
+def _ema_kernel(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the first value."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    alpha = 2.0 / (period + 1.0)
+    acc = float(values[0])
+    out[0] = acc
+    for i in range(1, n):
+        acc = alpha * values[i] + (1.0 - alpha) * acc
+        out[i] = acc
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi_kernel(close: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI; bars before the first full window read as neutral 50."""
+    n = close.shape[0]
+    out = np.full(n, 50.0)
+    if n <= period:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    gain /= period
+    loss /= period
+    out[period] = 100.0 if loss == 0.0 else 100.0 - 100.0 / (1.0 + gain / loss)
+    for i in range(period + 1, n):
+        delta = close[i] - close[i - 1]
+        gain = (gain * (period - 1) + max(delta, 0.0)) / period
+        loss = (loss * (period - 1) + max(-delta, 0.0)) / period
+        out[i] = 100.0 if loss == 0.0 else 100.0 - 100.0 / (1.0 + gain / loss)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _backtest_kernel(close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                     confidence_threshold: float, rsi_period: int, ema_fast: int, ema_slow: int,
+                     macd_fast: int, macd_slow: int, macd_signal: int, bollinger_period: int,
+                     bollinger_std: float, stop_loss_multiplier: float, take_profit_multiplier: float):
+    """Long-only backtest of one parameter set.
+
+    Entry when the share of agreeing signals (EMA trend, MACD over signal, RSI not
+    extreme, close under the upper Bollinger band) reaches ``confidence_threshold``;
+    exit on an ATR-scaled stop-loss or take-profit. Returns the _SWEEP_METRICS tuple,
+    with Sharpe computed per bar (not annualised).
+    """
+    n = close.shape[0]
+    fast = _ema_kernel(close, ema_fast)
+    slow = _ema_kernel(close, ema_slow)
+    macd = _ema_kernel(close, macd_fast) - _ema_kernel(close, macd_slow)
+    signal = _ema_kernel(macd, macd_signal)
+    rsi = _rsi_kernel(close, rsi_period)
+    true_range = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        true_range[i] = high[i] - low[i]
+        if i > 0:
+            true_range[i] = max(true_range[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    atr = _ema_kernel(true_range, _SWEEP_ATR_PERIOD)
+    warmup = max(ema_slow, macd_slow + macd_signal, bollinger_period, rsi_period, _SWEEP_ATR_PERIOD)
+
+    returns = np.zeros(n, dtype=np.float64)
+    window_sum = 0.0
+    window_sq = 0.0
+    in_position = False
+    entry = stop = target = 0.0
+    trades = 0
+    wins = 0
+    for i in range(n):
+        price = float(close[i])
+        window_sum += price
+        window_sq += price * price
+        if i >= bollinger_period:
+            old = float(close[i - bollinger_period])
+            window_sum -= old
+            window_sq -= old * old
+        if in_position:
+            if low[i] <= stop:
+                exit_price = stop
+            elif high[i] >= target:
+                exit_price = target
+            else:
+                exit_price = 0.0
+            returns[i] = (exit_price if exit_price > 0.0 else price) / close[i - 1] - 1.0
+            if exit_price > 0.0:
+                in_position = False
+                trades += 1
+                if exit_price > entry:
+                    wins += 1
+            continue
+        if i < warmup or atr[i] <= 0.0:
+            continue
+        mean = window_sum / bollinger_period
+        std = math.sqrt(max(window_sq / bollinger_period - mean * mean, 0.0))
+        score = 0.0
+        if fast[i] > slow[i]:
+            score += 0.25
+        if macd[i] > signal[i]:
+            score += 0.25
+        if 30.0 <= rsi[i] <= 70.0:
+            score += 0.25
+        if price < mean + bollinger_std * std:
+            score += 0.25
+        if score >= confidence_threshold:
+            in_position = True
+            entry = price
+            stop = price - stop_loss_multiplier * atr[i]
+            target = price + take_profit_multiplier * atr[i]
+    if in_position:
+        trades += 1
+        if close[n - 1] > entry:
+            wins += 1
+
+    equity = 1.0
+    peak = 1.0
+    max_drawdown = 0.0
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        r = returns[i]
+        total += r
+        total_sq += r * r
+        equity *= 1.0 + r
+        peak = max(peak, equity)
+        max_drawdown = max(max_drawdown, 1.0 - equity / peak)
+    sharpe = 0.0
+    if n > 1:
+        mean_r = total / n
+        std_r = math.sqrt(max(total_sq / n - mean_r * mean_r, 0.0))
+        if std_r > 0.0:
+            sharpe = mean_r / std_r
+    win_rate = wins / trades if trades else 0.0
+    return sharpe, equity - 1.0, max_drawdown, float(trades), win_rate
+
+
+def _evaluate_params(close: np.ndarray, high: np.ndarray, low: np.ndarray, combo: Tuple) -> Tuple:
+    """Run _backtest_kernel for one combination in OptimalParameters field order."""
+    (confidence, rsi_period, ema_fast, ema_slow, macd_fast, macd_slow, macd_signal,
+     bb_period, bb_std, sl_mult, tp_mult) = combo
+    return _backtest_kernel(close, high, low, float(confidence), int(rsi_period), int(ema_fast),
+                            int(ema_slow), int(macd_fast), int(macd_slow), int(macd_signal),
+                            int(bb_period), float(bb_std), float(sl_mult), float(tp_mult))
+
+
+def warm_sweep_kernels() -> None:
+    """Compile the jitted sweep kernels up front so the first sweep doesn't pay for it."""
+    if not NUMBA_AVAILABLE:
+        return
+    bars = np.ones(4, dtype=np.float32)
+    _backtest_kernel(bars, bars, bars, 0.5, 2, 2, 3, 2, 3, 2, 2, 2.0, 1.0, 1.0)
+
+
 class DynamicOptimizer:
     """Dynamic parameter optimization based on market conditions."""
     
@@ -414,6 +601,46 @@ class DynamicOptimizer:
             logger.warning("Dynamic confidence calculation failed for %s: %s", symbol, exc)
             return base_confidence
     
+    def sweep_regime_params(self, ohlcv: np.ndarray, grid: Dict[str, Sequence],
+                            regime: str = "sideways", n_jobs: int = -1) -> "pd.DataFrame":
+        """Backtest every parameter combination in ``grid`` and return one metrics row per set.
+
+        ``ohlcv`` holds ``[timestamp, open, high, low, close, volume]`` rows as returned by
+        ``fetch_ohlcv``. ``grid`` maps OptimalParameters field names to candidate values;
+        fields left out keep the ``regime`` base value. Combinations with a fast EMA/MACD
+        period not below the slow one are skipped. Sets are evaluated in parallel through
+        joblib when available; rows come back sorted by Sharpe, best first.
+        """
+        import pandas as pd
+
+        base = asdict(self.regime_parameters[regime])
+        unknown = set(grid) - base.keys()
+        if unknown:
+            raise ValueError(f"Unknown parameters in grid: {sorted(unknown)}")
+
+        keys = list(base)
+        combos = [
+            combo for combo in itertools.product(*(grid.get(key, (base[key],)) for key in keys))
+            if combo[2] < combo[3] and combo[4] < combo[5]  # ema_fast < ema_slow, macd_fast < macd_slow
+        ]
+
+        data = np.asarray(ohlcv, dtype=np.float32)
+        high = np.ascontiguousarray(data[:, 2])
+        low = np.ascontiguousarray(data[:, 3])
+        close = np.ascontiguousarray(data[:, 4])
+
+        if JOBLIB_AVAILABLE and n_jobs != 1 and len(combos) > 1:
+            metrics = Parallel(n_jobs=n_jobs, backend="loky")(
+                delayed(_evaluate_params)(close, high, low, combo) for combo in combos
+            )
+        else:
+            metrics = [_evaluate_params(close, high, low, combo) for combo in combos]
+
+        frame = pd.DataFrame(combos, columns=keys)
+        frame[list(_SWEEP_METRICS)] = pd.DataFrame(metrics, columns=_SWEEP_METRICS, index=frame.index)
+        frame["trades"] = frame["trades"].astype(int)
+        return frame.sort_values("sharpe", ascending=False, ignore_index=True)
+
     def _ema(self, data: np.ndarray, period: int) -> np.ndarray:
         """Calculate Exponential Moving Average."""
         if len(data) == 0:
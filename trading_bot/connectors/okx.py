@@ -66,6 +66,10 @@ class OkxConnector:
     def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         return self.market_data_breaker.call(self._client.fetch_ticker, symbol)
 
+    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch tickers for several symbols in one request, keyed by symbol."""
+        return self.market_data_breaker.call(self._client.fetch_tickers, symbols)
+
     def fetch_order_book(self, symbol: str, limit: int = 50) -> Dict[str, Any]:
         return self.market_data_breaker.call(self._client.fetch_order_book, symbol, limit=limit)
 
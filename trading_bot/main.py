@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from dotenv import load_dotenv
 
@@ -73,8 +74,12 @@ def _discover_symbols(okx, config) -> Iterable[str]:
     return list(config.bot.default_symbol_universe)
 
 
-def run_loop() -> None:
-    """Continuously scan markets and execute up to N trades per iteration."""
+def run_loop(stop_event: Optional[threading.Event] = None) -> None:
+    """Continuously scan markets and execute up to N trades per iteration.
+
+    Runs until interrupted or, when given, until ``stop_event`` is set; the check
+    happens between iterations and wakes the inter-iteration sleep.
+    """
 
     (
         config,
@@ -109,7 +114,8 @@ def run_loop() -> None:
 
     try:
         iteration_count = 0
-        while True:
+        stop = stop_event or threading.Event()
+        while not stop.is_set():
             iteration_start = time.time()
             try:
                 # Record iteration start
@@ -220,6 +226,9 @@ def run_loop() -> None:
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Trading iteration error: %s", exc)
 
+            # Write any symbols restricted during this iteration in one go
+            pipeline.flush_restricted_symbols()
+
             elapsed = time.time() - iteration_start
             performance_monitor.record_metric("main_loop", "iteration_time", elapsed, "seconds")
             performance_monitor.record_success_rate("main_loop", "iteration", True)
@@ -260,9 +269,11 @@ def run_loop() -> None:
             
             sleep_for = max(interval - elapsed, 0)
             if sleep_for:
-                time.sleep(sleep_for)
+                stop.wait(sleep_for)
     except KeyboardInterrupt:
         logger.info("Received interrupt, stopping trading loop")
+    finally:
+        pipeline.flush_restricted_symbols()
 
 
 if __name__ == "__main__":
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import time
 import numpy as np
+import orjson
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Optional
@@ -35,8 +37,66 @@ from trading_bot.monitoring.performance_monitor import PerformanceTimer, get_per
 from trading_bot.connectors.okx import OkxConnector
 from trading_bot.config import Config
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the numeric helpers run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+# OKX error payload fields, compiled once for _parse_okx_exception
+_SCODE_RE = re.compile(r'"sCode"\s*:\s*"([^"]+)"')
+_SMSG_RE = re.compile(r'"sMsg"\s*:\s*"([^"]*)"')
+_CODE_RE = re.compile(r'"code"\s*:\s*"([^"]+)"')
+_JSON_DECODER = json.JSONDecoder()
+
+# 10**-p for the integer price precisions OKX reports, avoiding libm pow on the hot path
+_TICK_POW10 = [10.0 ** -i for i in range(16)]
+
+# Shared read-only default for missing ``info`` dicts - never mutate
+_EMPTY: dict[str, Any] = {}
+
+
+def _fast_scode(message: str) -> Optional[str]:
+    """Pull ``sCode`` out of compact OKX JSON with plain string ops; None if not found."""
+    _, sep, tail = message.partition('"sCode":"')
+    if not sep:
+        return None
+    code, sep, _ = tail.partition('"')
+    return code if sep else None
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _book_depth(levels: np.ndarray, depth: int) -> float:
+    """Sum the size column of the top ``depth`` order book levels."""
+    total = 0.0
+    for i in range(min(depth, levels.shape[0])):
+        total += levels[i, 1]
+    return total
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _range_volatility(high: float, low: float, close: float) -> float:
+    """Daily high/low range relative to the last price."""
+    if close <= 0.0:
+        return 0.0
+    return (high - low) / close
+
+
+def _warmup() -> None:
+    """Compile the jitted helpers up front so the first tick doesn't pay JIT latency."""
+    if not NUMBA_AVAILABLE:
+        return
+    _book_depth(np.zeros((5, 2)), 5)
+    _range_volatility(0.0, 0.0, 1.0)
+
 
 @dataclass
 class MarketState:
@@ -75,6 +135,13 @@ class Position:
 class TradingPipeline:
     """Encapsulates data retrieval, analysis, decisioning, and execution."""
 
+    # OKX order error code -> handler method name (see _handle_order_error)
+    _ERROR_HANDLERS = {
+        "51155": "_handle_restricted",
+        "51201": "_log_notional_cap",
+        "51008": "_log_insufficient_balance",
+    }
+
     def __init__(
         self,
         config: Config,
@@ -82,6 +149,8 @@ class TradingPipeline:
         macro_provider: MacroDataProvider,
         onchain_provider: OnChainDataProvider,
     ) -> None:
+        _warmup()
+
         self._config = config
         self._okx = okx
         self._macro_provider = macro_provider
@@ -106,9 +175,13 @@ class TradingPipeline:
         self._positions: dict[str, Position] = {}
         self._restricted_cache_path = Path("data/okx_restricted_symbols.json")
         self._restricted_symbols: set[str] = set()
+        self._restricted_dirty = False  # Unsaved restrictions, flushed once per loop iteration
         self._last_order_error: Optional[dict[str, str]] = None
+        self._tick_size_cache: dict[str, float] = {}  # Tick sizes are static per symbol for the session
+        self._mtf_cache: dict[tuple[str, int], Any] = {}  # (symbol, minute bucket) -> multi-timeframe data
         self._positions_cache_path = Path("data/bot_positions.json")  # Persist positions across restarts
         self._last_reconciliation_time = 0  # Throttle reconciliation to every 60 seconds
+        self._last_mgmt_eval: dict[str, tuple[float, float]] = {}  # symbol -> (last_price, monotonic ts)
         
         # Load existing positions from exchange on startup
         self._load_existing_positions()
@@ -572,6 +645,7 @@ class TradingPipeline:
                 logger.info("🗑️ REMOVING %d CLOSED POSITIONS from tracking", len(positions_to_remove))
                 for symbol in positions_to_remove:
                     del self._positions[symbol]
+                    self._last_mgmt_eval.pop(symbol, None)
                     logger.info("   ✅ Removed: %s", symbol)
                 
                 # Save updated positions
@@ -851,7 +925,7 @@ class TradingPipeline:
             low = float(ticker.get("low", 0))
             close = float(ticker.get("last", 0))
             if close > 0:
-                daily_volatility = (high - low) / close
+                daily_volatility = _range_volatility(high, low, close)
                 if daily_volatility > 0.30:  # >30% daily volatility
                     return True, "volatility-explosion"
         except Exception:
@@ -1772,6 +1846,7 @@ class TradingPipeline:
             order = self._submit_order(symbol, "market", "sell", existing_position.amount, price)
             if order:
                 del self._positions[symbol]
+                self._last_mgmt_eval.pop(symbol, None)
                 # CRITICAL: Save positions to file after deletion
                 self._save_positions()
                 return True, None
@@ -1829,7 +1904,7 @@ class TradingPipeline:
         try:
             # Get current balance
             balance = self._okx.fetch_balance()
-            quote = symbol.split("/")[-1]
+            quote = symbol.rpartition("/")[2] or symbol
             free_quote = 0.0
             try:
                 free_quote = float(balance.get("free", {}).get(quote, 0.0))
@@ -1899,7 +1974,7 @@ class TradingPipeline:
             logger.warning("Risk check skipped due to balance fetch error: %s", exc)
             return True
 
-        quote = symbol.split("/")[-1]
+        quote = symbol.rpartition("/")[2] or symbol
         free_balance = balance.get("free", {}).get(quote, 0.0)
         min_balance = self._config.bot.min_quote_balance
         if free_balance < min_balance:
@@ -1938,6 +2013,16 @@ class TradingPipeline:
         try:
             symbol = state.symbol
             
+            # Cheap pre-gate: skip all I/O unless price moved >=0.2% or 30s elapsed
+            now = time.monotonic()
+            last_eval = self._last_mgmt_eval.get(symbol)
+            if last_eval and last_eval[0] > 0:
+                last_price, last_ts = last_eval
+                if abs(current_price - last_price) / last_price < 0.002 and now - last_ts < 30:
+                    logger.debug("⏭️ Skipping position re-evaluation for %s (no meaningful change)", symbol)
+                    return
+            self._last_mgmt_eval[symbol] = (current_price, now)
+            
             # Get fresh market analysis for the position
             mtf_data = self._market_data.get_multi_timeframe_data(symbol)
             if not mtf_data:
@@ -2023,10 +2108,9 @@ class TradingPipeline:
         if pnl_percentage < -1.0:  # Earlier intervention at -1%
             try:
                 # Get enhanced market condition analysis
+                # ticker/current_price come from the caller - no need to re-fetch
                 signal_analyzer = get_enhanced_signal_analyzer()
-                ticker = self._okx.fetch_ticker(position.symbol)
-                current_price = float(ticker["last"])
-                
+
                 # Get comprehensive multi-timeframe analysis for position management
                 try:
                     # Multi-timeframe analysis for position management
@@ -2115,8 +2199,8 @@ class TradingPipeline:
             bids = order_book.get("bids", [])[:5]
             asks = order_book.get("asks", [])[:5]
             if bids and asks:
-                bid_volume = sum(float(level[1]) for level in bids)
-                ask_volume = sum(float(level[1]) for level in asks)
+                bid_volume = _book_depth(np.asarray(bids, dtype=np.float64), 5)
+                ask_volume = _book_depth(np.asarray(asks, dtype=np.float64), 5)
                 total_liquidity = bid_volume + ask_volume
                 
                 # If liquidity is very low, exit to avoid slippage
@@ -2136,7 +2220,7 @@ class TradingPipeline:
             low = float(ticker.get("low", 0))
             close = float(ticker.get("last", 0))
             if close > 0:
-                daily_volatility = (high - low) / close
+                daily_volatility = _range_volatility(high, low, close)
                 if daily_volatility > 0.20 and pnl_percentage < -1.0:  # >20% volatility while losing
                     return True, "volatility-spike"
         except Exception:
@@ -2160,6 +2244,7 @@ class TradingPipeline:
             self._okx.create_order(symbol, "market", "sell", position.amount)
             logger.info("Closed %s due to %s", symbol, reason)
             del self._positions[symbol]
+            self._last_mgmt_eval.pop(symbol, None)
             # CRITICAL: Save positions to file after deletion
             self._save_positions()
         except Exception as exc:  # noqa: BLE001
@@ -2308,19 +2393,55 @@ class TradingPipeline:
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to load restricted symbol cache: %s", exc)
 
-    def _persist_restricted_symbols(self) -> None:
+    def flush_restricted_symbols(self) -> None:
+        """Persist restricted symbols marked since the last flush, if any."""
+        if not self._restricted_dirty:
+            return
+        # Stay dirty after a failed write so the next flush retries it
+        if self._persist_restricted_symbols():
+            self._restricted_dirty = False
+
+    def _persist_restricted_symbols(self) -> bool:
+        """Write the restricted-symbol cache; returns False if the write failed."""
         try:
             self._restricted_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            payload = sorted(self._restricted_symbols)
-            self._restricted_cache_path.write_text(json.dumps(payload))
+            payload = list(self._restricted_symbols)  # Order is irrelevant to the loader
+            # Write to a temp file and swap it in so a crash never leaves a truncated cache
+            tmp_path = self._restricted_cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(payload))
+            os.replace(tmp_path, self._restricted_cache_path)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to persist restricted symbols: %s", exc)
+            return False
+        return True
 
     def _parse_okx_exception(self, message: str) -> Optional[dict[str, str]]:
-        code_match = re.search(r'"sCode"\s*:\s*"([^"]+)"', message)
-        msg_match = re.search(r'"sMsg"\s*:\s*"([^"]*)"', message)
+        # Neither key present (timeouts, network errors...) - nothing to parse
+        if '"sCode"' not in message and '"code"' not in message:
+            return None
+        code = _fast_scode(message)
+        if code:
+            msg_match = _SMSG_RE.search(message)
+            return {"code": code, "message": msg_match.group(1) if msg_match else "", "raw": message}
+
+        # ccxt appends the raw OKX JSON body after the exchange id - decode it directly
+        brace = message.find("{")
+        if brace >= 0:
+            try:
+                body, _ = _JSON_DECODER.raw_decode(message, brace)
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                data = body.get("data")
+                entry = data[0] if isinstance(data, list) and data and isinstance(data[0], dict) else {}
+                code = entry.get("sCode") or body.get("code")
+                if code:
+                    return {"code": str(code), "message": str(entry.get("sMsg") or ""), "raw": message}
+
+        code_match = _SCODE_RE.search(message)
+        msg_match = _SMSG_RE.search(message)
         if not code_match and "code" in message:
-            code_match = re.search(r'"code"\s*:\s*"([^"]+)"', message)
+            code_match = _CODE_RE.search(message)
         if not code_match:
             return None
         return {
@@ -2330,35 +2451,40 @@ class TradingPipeline:
         }
 
     def _handle_order_error(self, symbol: str, error: dict[str, str]) -> None:
-        code = error.get("code")
-        if code == "51155":
-            self._mark_symbol_restricted(symbol)
-        elif code == "51201":
-            logger.warning(
-                "Market order for %s exceeded OKX notional cap: %s",
-                symbol,
-                error.get("message"),
-            )
-        elif code == "51008":
-            logger.warning(
-                "Insufficient balance when placing OCO for %s: %s",
-                symbol,
-                error.get("message"),
-            )
+        handler = self._ERROR_HANDLERS.get(error.get("code"))
+        if handler:
+            getattr(self, handler)(symbol, error)
+
+    def _handle_restricted(self, symbol: str, error: dict[str, str]) -> None:
+        self._mark_symbol_restricted(symbol)
+
+    def _log_notional_cap(self, symbol: str, error: dict[str, str]) -> None:
+        logger.warning(
+            "Market order for %s exceeded OKX notional cap: %s",
+            symbol,
+            error.get("message"),
+        )
+
+    def _log_insufficient_balance(self, symbol: str, error: dict[str, str]) -> None:
+        logger.warning(
+            "Insufficient balance when placing OCO for %s: %s",
+            symbol,
+            error.get("message"),
+        )
 
     def _mark_symbol_restricted(self, symbol: str) -> None:
         if symbol not in self._restricted_symbols:
             logger.warning("Marking %s as restricted by OKX compliance (51155)", symbol)
             self._restricted_symbols.add(symbol)
             setattr(self._onchain_provider, "restricted_symbols", self._restricted_symbols)
-            self._persist_restricted_symbols()
+            self._restricted_dirty = True
 
     def _extract_filled_amount(self, order: dict[str, Any], default: Optional[float] = None) -> Optional[float]:
         """Extract filled amount from order - returns default if no real data."""
         try:
             filled = order.get("filled")
             if filled is None:
-                info = order.get("info", {})
+                info = order.get("info") or _EMPTY
                 filled = info.get("fillSz") or info.get("accFillSz") or order.get("amount")
             filled = float(filled)
             if filled and filled > 0:
@@ -2372,7 +2498,7 @@ class TradingPipeline:
         try:
             avg_price = order.get("average") or order.get("price")
             if avg_price is None:
-                info = order.get("info", {})
+                info = order.get("info") or _EMPTY
                 avg_price = info.get("avgPx") or info.get("fillPx")
             if avg_price and float(avg_price) > 0:
                 return float(avg_price)
@@ -2382,6 +2508,9 @@ class TradingPipeline:
 
     def _get_tick_size(self, symbol: str) -> Optional[float]:
         """Get tick size from market - returns None if no real data."""
+        cached = self._tick_size_cache.get(symbol)
+        if cached is not None:
+            return cached
         try:
             market = self._okx.get_market(symbol)
             if not market:
@@ -2393,8 +2522,13 @@ class TradingPipeline:
         price_precision = precision.get("price")
         if price_precision is not None:
             try:
-                tick_size = pow(10, -float(price_precision))
+                digits = float(price_precision)
+                if digits.is_integer() and 0 <= digits < len(_TICK_POW10):
+                    tick_size = _TICK_POW10[int(digits)]
+                else:
+                    tick_size = pow(10, -digits)
                 if tick_size > 0:
+                    self._tick_size_cache[symbol] = tick_size
                     return tick_size
             except Exception:
                 pass
@@ -2405,6 +2539,7 @@ class TradingPipeline:
             try:
                 tick_size = float(tick)
                 if tick_size > 0:
+                    self._tick_size_cache[symbol] = tick_size
                     return tick_size
             except Exception:
                 pass
@@ -2416,11 +2551,17 @@ class TradingPipeline:
     ) -> tuple[float, float]:
         """Calculate dynamic TP/SL levels using enhanced multi-timeframe technical analysis."""
         try:
-            # Get multi-timeframe data
-            mtf_data = self._market_data.get_multi_timeframe_data(symbol)
+            # Get multi-timeframe data (reused within the same minute, e.g. entry and post-fill levels)
+            minute = int(time.time() // 60)
+            key = (symbol, minute)
+            mtf_data = self._mtf_cache.get(key)
             if not mtf_data:
-                logger.error("❌ NO MULTI-TIMEFRAME DATA for %s - NO fallback", symbol)
-                return None, None
+                mtf_data = self._market_data.get_multi_timeframe_data(symbol)
+                if not mtf_data:
+                    logger.error("❌ NO MULTI-TIMEFRAME DATA for %s - NO fallback", symbol)
+                    return None, None
+                self._mtf_cache = {k: v for k, v in self._mtf_cache.items() if k[1] >= minute - 5}
+                self._mtf_cache[key] = mtf_data
             
             # Use enhanced multi-timeframe technical analysis
             stop_loss, take_profit = self._technical.calculate_dynamic_levels_mtf(
@@ -0,0 +1,43 @@
+"""Compile every numba kernel ahead of time.
+
+The kernels are declared with ``cache=True``, so running ``python -m trading_bot.warmup``
+once after installing (for example as a Docker build step) stores the compiled code
+next to the sources and later processes load it instead of paying JIT latency on
+first use.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from trading_bot.analytics.advanced_portfolio import warm_portfolio_kernels
+from trading_bot.analytics.daily_performance import NUMBA_AVAILABLE, warm_summary_kernel
+from trading_bot.analytics.dynamic_optimizer import warm_sweep_kernels
+
+logger = logging.getLogger(__name__)
+
+
+def warm_all() -> None:
+    """Compile (or load from cache) the pipeline, performance, sweep and allocation kernels."""
+    if not NUMBA_AVAILABLE:
+        logger.info("numba not installed - nothing to warm up")
+        return
+
+    # Imported here: the pipeline module pulls in the exchange/analytics stack
+    from trading_bot.orchestration.pipeline import _warmup as warm_pipeline_kernels
+
+    for name, warm in (
+        ("pipeline", warm_pipeline_kernels),
+        ("daily performance", warm_summary_kernel),
+        ("parameter sweep", warm_sweep_kernels),
+        ("portfolio allocation", warm_portfolio_kernels),
+    ):
+        start = time.perf_counter()
+        warm()
+        logger.info("Warmed %s kernels in %.2fs", name, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    warm_all()